@@ -0,0 +1,109 @@
+"""
+Chargement des images et des sons (pygame), une seule fois par fichier
+- Images décodées une fois, mises à l'échelle, puis converties au format de
+  l'écran (convert / convert_alpha) : les blits par frame n'ont plus de
+  conversion de pixels à faire
+- Cache disque optionnel : pixels bruts déjà mis à l'échelle, clé = chemin +
+  date de modification + taille (un fichier modifié est re-décodé)
+- Sons chargés au premier play() seulement (SonDiffere)
+"""
+
+import hashlib, os, struct
+
+import pygame
+
+# =============================================================================
+# === Son chargé à la première lecture ===
+# =============================================================================
+class SonDiffere:
+    def __init__(self, path):
+        self.path = path
+        self._son = None
+        self._erreur = False
+
+    def charger(self):
+        if self._son is None and not self._erreur:
+            try:
+                self._son = pygame.mixer.Sound(self.path)
+            except Exception as e:
+                print("⚠️ Son non chargé :", self.path, e)
+                self._erreur = True  # pas de nouvel essai à chaque play()
+        return self._son
+
+    def play(self, *args, **kwargs):
+        son = self.charger()
+        if son is not None:
+            return son.play(*args, **kwargs)
+        return None
+
+    def __getattr__(self, nom):
+        # set_volume, stop, get_length... : délégués au vrai Sound
+        if nom.startswith("_"):
+            raise AttributeError(nom)
+        son = self.charger()
+        if son is None:
+            raise AttributeError(nom)
+        return getattr(son, nom)
+
+# =============================================================================
+# === Gestionnaire d'assets ===
+# =============================================================================
+_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+_frombytes = getattr(pygame.image, "frombytes", None) or pygame.image.fromstring
+
+class Assets:
+    def __init__(self, dossier_cache=None):
+        """dossier_cache : dossier du cache disque des images (None = pas de cache disque)"""
+        self.dossier_cache = dossier_cache
+        self.images = {}
+        self.sons = {}
+
+    def _chemin_cache(self, path, taille, alpha):
+        cle = f"{os.path.abspath(path)}|{os.stat(path).st_mtime_ns}|{taille}|{alpha}"
+        return os.path.join(self.dossier_cache, hashlib.sha1(cle.encode()).hexdigest() + ".raw")
+
+    def _lire_cache(self, fichier, alpha):
+        try:
+            with open(fichier, "rb") as f:
+                w, h = struct.unpack("<II", f.read(8))
+                return _frombytes(f.read(), (w, h), "RGBA" if alpha else "RGB")
+        except (OSError, ValueError, struct.error, pygame.error):
+            return None
+
+    def _ecrire_cache(self, fichier, surface, alpha):
+        try:
+            os.makedirs(self.dossier_cache, exist_ok=True)
+            tmp = fichier + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(struct.pack("<II", *surface.get_size()))
+                f.write(_tobytes(surface, "RGBA" if alpha else "RGB"))
+            os.replace(tmp, fichier)
+        except OSError as e:
+            print("⚠️ Cache image non écrit :", e)
+
+    def image(self, path, taille=None, alpha=False):
+        """Surface convertie (et mise à l'échelle) ; la même instance est rendue à chaque appel"""
+        cle = (path, taille, alpha)
+        surface = self.images.get(cle)
+        if surface is not None:
+            return surface
+
+        fichier = self._chemin_cache(path, taille, alpha) if self.dossier_cache else None
+        surface = self._lire_cache(fichier, alpha) if fichier else None
+        if surface is None:
+            surface = pygame.image.load(path)
+            if taille is not None:
+                surface = pygame.transform.scale(surface, taille)
+            if fichier:
+                self._ecrire_cache(fichier, surface, alpha)
+
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        self.images[cle] = surface
+        return surface
+
+    def son(self, path):
+        son = self.sons.get(path)
+        if son is None:
+            son = SonDiffere(path)
+            self.sons[path] = son
+        return son
@@ -0,0 +1,62 @@
+"""
+Effets sonores regroupés par frame, sur un pool fixe de canaux
+- jouer(son) ne fait que noter la demande : les demandes identiques d'une même
+  frame (30 bots qui passent le même tuyau, 10 morts d'un coup) ne donnent
+  qu'une seule lecture
+- fin_frame() lance au plus MAX_PAR_FRAME sons distincts sur les canaux
+  réservés ; si tous les canaux sont occupés, le son est abandonné
+- Les autres canaux du mixer (et mixer.music) ne sont pas touchés
+"""
+
+import pygame
+
+NB_CANAUX = 4      # canaux réservés aux effets
+MAX_PAR_FRAME = 3  # sons distincts lancés par frame au maximum
+
+# =============================================================================
+# === Mixeur d'événements sonores ===
+# =============================================================================
+class MixeurEvenements:
+    def __init__(self, nb_canaux=NB_CANAUX, max_par_frame=MAX_PAR_FRAME):
+        self.max_par_frame = max_par_frame
+        self.en_attente = {}  # son -> nombre de demandes dans la frame (ordre d'arrivée)
+        self.joues = 0
+        self.fusionnes = 0    # demandes regroupées avec une autre identique
+        self.abandonnes = 0   # pas de canal libre / trop de sons dans la frame
+        self.canaux = []
+        if pygame.mixer.get_init():
+            nb_canaux = min(nb_canaux, pygame.mixer.get_num_channels())
+            pygame.mixer.set_reserved(nb_canaux)  # find_channel / Sound.play ne les prendront pas
+            self.canaux = [pygame.mixer.Channel(i) for i in range(nb_canaux)]
+
+    def jouer(self, son):
+        """Demande la lecture de son (Sound ou SonDiffere) à la fin de la frame"""
+        if son is None:
+            return
+        self.en_attente[son] = self.en_attente.get(son, 0) + 1
+
+    def _canal_libre(self):
+        for canal in self.canaux:
+            if not canal.get_busy():
+                return canal
+        return None
+
+    def fin_frame(self):
+        if not self.en_attente:
+            return
+        for i, (son, nb) in enumerate(self.en_attente.items()):
+            self.fusionnes += nb - 1
+            canal = self._canal_libre() if i < self.max_par_frame else None
+            sound = son.charger() if hasattr(son, "charger") else son
+            if canal is None or sound is None:
+                self.abandonnes += 1
+                continue
+            canal.play(sound)
+            self.joues += 1
+        self.en_attente.clear()
+
+    def vider(self):
+        """Oublie les demandes en attente et coupe les effets en cours (changement d'écran)"""
+        self.en_attente.clear()
+        for canal in self.canaux:
+            canal.stop()
@@ -0,0 +1,223 @@
+"""
+Banc de mesure de la vitesse de simulation (sans affichage)
+- Chaque variante du jeu est jouée sans affichage sur un parcours seedé (mêmes
+  tuyaux d'un lancement à l'autre) : moteur headless (FlipBird_Sim,
+  FlipBird_EnvRL) quand il existe, sinon une copie scalaire de la boucle du
+  script (regle, rl1_rl2)
+- Mesures : pas/s (frames x oiseaux ou transitions), générations/s pour le GA,
+  pic mémoire (tracemalloc, mesuré dans un second passage pour ne pas fausser
+  le chronométrage)
+- Résultats écrits en JSON (--sortie) pour comparer deux versions du code
+
+Variantes :
+  regle         boucle de FlipBird_RuleBase et son bot (tolérance 20) ; même
+                physique que Flipbird1_manu / FlipBird2_Auto : un tuyau au
+                départ, le suivant en x = LARGEUR dès que le dernier passe sous
+                LARGEUR - 200 ; parties enchaînées
+  rl1_rl2       physique de RL1 / RL2 avec leur bot à seuil : deux tuyaux au
+                départ (x = LARGEUR et LARGEUR + 220), le suivant à 220 px du
+                dernier ; parties enchaînées
+  ga_tam        GA de FlipBird_GA_TAM (moteur Python, population 30)
+  ga_tam_numpy  même GA, moteur vectorisé FlipBird_SimNumpy
+  ga_table      GA de FlipBird_GA_Table (population 20)
+  rl1_qtable    entraînement de la Q-table de RL1 (FlipBird_QTable, 256
+                parties vectorisées) : mesure l'entraînement, pas le jeu
+  rl3_env       environnements vectorisés de RL3, actions aléatoires
+  rl3_dqn       entraînement DQN de RL3 (si torch est installé)
+
+Exemple : python FlipBird_Bench.py --sortie bench.json
+"""
+
+import argparse, json, platform, sys, time, tracemalloc
+import numpy as np
+
+VARIANTES = ("regle", "rl1_rl2", "ga_tam", "ga_tam_numpy", "ga_table", "rl1_qtable", "rl3_env", "rl3_dqn")
+BENCH_PATH = "bench_results.json"
+SEED = 1234
+MAX_FRAMES = 5000  # frames max par génération GA (un bon bot ne meurt jamais)
+
+# =============================================================================
+# === Variantes : chacune renvoie un dict de compteurs ===
+# =============================================================================
+def _boucle_script(lecteur_suivant, pas, espacement_fixe):
+    """Boucle de jeu des scripts 400 x 600 (rayon 15), sans pygame ; une partie
+    perdue est relancée. espacement_fixe=False : RuleBase / FlipBird2_Auto,
+    True : RL1 / RL2. Renvoie le nombre de parties jouées"""
+    largeur, hauteur, rayon, largeur_tuyau, ecart, o_x = 400, 600, 15, 60, 150, 60
+    lecteur = lecteur_suivant()
+
+    def creer_tuyau():
+        h = lecteur.suivant()
+        return {"x": largeur, "haut": h, "bas": h + ecart}
+
+    def nouvelle_partie():
+        tuyaux = [creer_tuyau()]
+        if espacement_fixe:
+            tuyaux.append(creer_tuyau())
+            tuyaux[1]["x"] = tuyaux[0]["x"] + 220
+        return hauteur // 2, 0, tuyaux
+
+    o_y, v, tuyaux = nouvelle_partie()
+    parties = 1
+    for _ in range(pas):
+        # Bot à seuil (tolérance 20) sur le prochain tuyau
+        prochain = tuyaux[0]
+        if prochain["x"] + largeur_tuyau < o_x and len(tuyaux) > 1:
+            prochain = tuyaux[1]
+        if espacement_fixe:
+            centre = (prochain["haut"] + prochain["bas"]) / 2
+        else:
+            centre = (prochain["haut"] + prochain["bas"]) // 2
+        if o_y > centre + 20:
+            v = -8
+        v += 0.5
+        o_y += v
+
+        for t in tuyaux:
+            t["x"] -= 3
+        if tuyaux[-1]["x"] < largeur - 200:
+            nouveau = creer_tuyau()
+            if espacement_fixe:
+                nouveau["x"] = tuyaux[-1]["x"] + 220
+            tuyaux.append(nouveau)
+        if tuyaux[0]["x"] + largeur_tuyau < 0:
+            tuyaux.pop(0)
+
+        mort = o_y - rayon < 0 or o_y + rayon > hauteur
+        for t in tuyaux:
+            if o_x + rayon > t["x"] and o_x - rayon < t["x"] + largeur_tuyau:
+                if o_y - rayon < t["haut"] or o_y + rayon > t["bas"]:
+                    mort = True
+        if mort:
+            lecteur = lecteur_suivant()
+            o_y, v, tuyaux = nouvelle_partie()
+            parties += 1
+    return parties
+
+def bench_regle(echelle, seed):
+    from FlipBird_Course import Course
+    course = Course(seed, 100, 400)
+    pas = 20000 * echelle
+    return {"pas": pas, "parties": _boucle_script(course.lecteur, pas, False)}
+
+def bench_rl1_rl2(echelle, seed):
+    from FlipBird_Course import Course
+    course = Course(seed, 100, 400)
+    pas = 20000 * echelle
+    return {"pas": pas, "parties": _boucle_script(course.lecteur, pas, True)}
+
+def _ga(population_cls, generations, pop_size, seed):
+    import random
+    from FlipBird_Sim import Simulation, nouvelle_course, next_generation
+    rng = random.Random(seed)
+    thresholds = [rng.uniform(-50, 50) for _ in range(pop_size)]
+    course = nouvelle_course(seed)
+    pas = 0
+    for _ in range(generations):
+        sim = Simulation(population_cls(thresholds), course)
+        scores = sim.run(MAX_FRAMES)
+        pas += sim.frame * pop_size
+        thresholds = next_generation(thresholds, scores, pop_size, rng)
+    return {"pas": pas, "generations": generations}
+
+def bench_ga_tam(echelle, seed):
+    from FlipBird_Sim import Population
+    return _ga(Population, 10 * echelle, 30, seed)
+
+def bench_ga_tam_numpy(echelle, seed):
+    from FlipBird_SimNumpy import PopulationNumpy
+    return _ga(PopulationNumpy, 10 * echelle, 30, seed)
+
+def bench_ga_table(echelle, seed):
+    from FlipBird_Sim import Population
+    return _ga(Population, 10 * echelle, 20, seed)
+
+def bench_rl1_qtable(echelle, seed):
+    from FlipBird_QTable import entrainer_q
+    pas, parties = 2000 * echelle, 256
+    entrainer_q(pas, parties, seed=seed, verbose=False)
+    return {"pas": pas * parties}
+
+def bench_rl3_env(echelle, seed):
+    from FlipBird_EnvRL import VecFlappyEnv
+    env = VecFlappyEnv(32, seed=seed)
+    rng = np.random.default_rng(seed)
+    pas = 5000 * echelle
+    for _ in range(pas):
+        env.step(rng.random(32) < 0.1)
+    return {"pas": pas * 32}
+
+def bench_rl3_dqn(echelle, seed):
+    from FlipBird_DQN import TORCH_AVAILABLE, Agent, train_vectorized
+    if not TORCH_AVAILABLE:
+        return None
+    import torch
+    from FlipBird_EnvRL import VecFlappyEnv
+    torch.manual_seed(seed)
+    agent = Agent(seed=seed)
+    env = VecFlappyEnv(32, seed=seed)
+    pas = 100 * echelle
+    train_vectorized(agent, env, pas)
+    return {"pas": pas * 32, "mises_a_jour": agent.steps}
+
+# =============================================================================
+# === Mesure ===
+# =============================================================================
+def mesurer(nom, echelle=1, seed=SEED, memoire=True):
+    fonction = globals()["bench_" + nom]
+    fonction(0, seed)  # charge d'abord les modules (import de torch...) hors chronomètre
+    t0 = time.perf_counter()
+    compteurs = fonction(echelle, seed)
+    duree = time.perf_counter() - t0
+    if compteurs is None:
+        return {"variante": nom, "ignoree": "dépendance absente"}
+    resultat = {"variante": nom, "secondes": round(duree, 4)}
+    for cle, val in compteurs.items():
+        resultat[cle] = val
+        resultat[cle + "_par_s"] = round(val / duree, 2)
+    if memoire:
+        tracemalloc.start()
+        fonction(echelle, seed)
+        resultat["pic_memoire_mo"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 3)
+        tracemalloc.stop()
+    return resultat
+
+def main():
+    parser = argparse.ArgumentParser(description="Vitesse de simulation des variantes FlipBird")
+    parser.add_argument("variantes", nargs="*", metavar="VARIANTE",
+                        help="parmi " + ", ".join(VARIANTES) + " (défaut : toutes)")
+    parser.add_argument("--echelle", type=int, default=1, help="multiplie la charge de chaque variante")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--sans-memoire", action="store_true", help="pas de second passage tracemalloc")
+    parser.add_argument("--sortie", default=BENCH_PATH)
+    args = parser.parse_args()
+    inconnues = [v for v in args.variantes if v not in VARIANTES]
+    if inconnues:
+        parser.error("variante(s) inconnue(s) : " + ", ".join(inconnues))
+
+    resultats = []
+    for nom in args.variantes or VARIANTES:
+        r = mesurer(nom, args.echelle, args.seed, not args.sans_memoire)
+        resultats.append(r)
+        if "ignoree" in r:
+            print(f"{nom:14s} ignorée ({r['ignoree']})")
+            continue
+        gens = f" | {r['generations_par_s']:.2f} gen/s" if "generations" in r else ""
+        mem = f" | pic {r['pic_memoire_mo']:.1f} Mo" if "pic_memoire_mo" in r else ""
+        print(f"{nom:14s} {r['pas_par_s']:>12,.0f} pas/s{gens}{mem}")
+
+    rapport = {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "plateforme": platform.platform(),
+        "seed": args.seed,
+        "echelle": args.echelle,
+        "resultats": resultats,
+    }
+    with open(args.sortie, "w", encoding="utf-8") as f:
+        json.dump(rapport, f, indent=2, ensure_ascii=False)
+    print("Résultats :", args.sortie)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Collisions contre le seul tuyau de la colonne de l'oiseau
+- L'oiseau reste en x = BIRD_X : au plus un tuyau chevauche sa colonne
+  [BIRD_X - RAYON, BIRD_X + RAYON] (tuyaux espacés de ~200 px, colonne + tuyau
+  = 84 px). Colonne garde l'index de ce tuyau dans la FileTuyaux et avance
+  avec le défilement : plus de boucle sur tous les tuyaux à l'écran
+- collision_population : toute une population testée d'un coup (NumPy) contre
+  ce tuyau, plafond et sol compris
+- collision_balayee : test continu sur un grand pas de n frames (avance
+  rapide). Entre deux sauts l'oiseau suit la parabole de la gravité
+  (y_k = y0 + k v0 + g k(k+1)/2) et le tuyau recule de VITESSE_TUYAUX par
+  frame ; le point le plus haut de l'arc est testé s'il tombe pendant le
+  passage du tuyau. Un pas contenant un saut se découpe en un appel par arc
+- Vérification contre une simulation frame par frame : python FlipBird_Collision.py
+"""
+
+import numpy as np
+
+# =============================================================================
+# === Paramètres (identiques à FlipBird_GA_TAM) ===
+# =============================================================================
+HAUTEUR = 600
+GRAVITE = 0.5
+SAUT = -8
+VITESSE_TUYAUX = 3
+LARGEUR_TUYAU = 60
+RAYON = 12
+BIRD_X = 60
+
+# =============================================================================
+# === Tuyau de la colonne de l'oiseau ===
+# =============================================================================
+class Colonne:
+    def __init__(self, bird_x=BIRD_X, rayon=RAYON, largeur_tuyau=LARGEUR_TUYAU):
+        self.gauche = bird_x - rayon - largeur_tuyau  # chevauchement si gauche < x < droite
+        self.droite = bird_x + rayon
+        self.k = 0          # curseur dans la FileTuyaux (index absolu)
+        self.tuyau = -1     # index du tuyau dans la colonne, -1 si aucun
+        self.haut = self.bas = None
+
+    def maj(self, tuyaux):
+        """À appeler une fois par frame après tuyaux.avancer() ; renvoie l'index ou -1"""
+        k = self.k
+        if k < tuyaux.debut or k >= tuyaux.fin:  # nouvelle partie (reset) ou tuyau retiré
+            k = tuyaux.debut
+        # Les tuyaux entièrement passés à gauche de la colonne ne reviennent pas
+        while k < tuyaux.fin - 1 and tuyaux.x(k) <= self.gauche:
+            k += 1
+        self.k = k
+        if self.gauche < tuyaux.x(k) < self.droite:
+            self.tuyau = k
+            self.haut, self.bas = tuyaux.trou(k)
+        else:
+            self.tuyau = -1
+            self.haut = self.bas = None
+        return self.tuyau
+
+    def touche(self, y, rayon=RAYON):
+        """Un oiseau (y scalaire) touche-t-il le tuyau de la colonne ?"""
+        return self.tuyau >= 0 and (y - rayon < self.haut or y + rayon > self.bas)
+
+# =============================================================================
+# === Tests vectorisés ===
+# =============================================================================
+def collision_population(y, colonne, rayon=RAYON, hauteur=HAUTEUR, out=None, tmp=None):
+    """Tableau bool : plafond, sol ou tuyau de la colonne (out / tmp : tampons préalloués)"""
+    if out is None:
+        out = np.empty(np.shape(y), dtype=bool)
+    if tmp is None:
+        tmp = np.empty(np.shape(y), dtype=bool)
+    # Le tuyau ne laisse que ]haut + rayon, bas - rayon[ ; sans tuyau, ]rayon, hauteur - rayon[
+    if colonne.tuyau >= 0:
+        bas_min, haut_max = max(colonne.haut, 0) + rayon, min(colonne.bas, hauteur) - rayon
+    else:
+        bas_min, haut_max = rayon, hauteur - rayon
+    np.less(y, bas_min, out=out)
+    np.greater(y, haut_max, out=tmp)
+    out |= tmp
+    return out
+
+def _hauteur_arc(y0, v0, s, gravite):
+    """y après s frames sans saut (s réel : parabole passant par chaque frame)"""
+    return y0 + s * v0 + gravite * s * (s + 1) / 2
+
+def _extremes_arc(y0, v0, s_a, s_b, gravite):
+    """(y min, y max) de l'arc sur [s_a, s_b] : bords + sommet s'il est dedans"""
+    ya, yb = _hauteur_arc(y0, v0, s_a, gravite), _hauteur_arc(y0, v0, s_b, gravite)
+    y_min, y_max = np.minimum(ya, yb), np.maximum(ya, yb)
+    if gravite:
+        # dy/ds = v0 + g (s + 1/2) = 0 ; clip : sommet hors fenêtre -> un bord
+        sommet = np.clip(-v0 / gravite - 0.5, s_a, s_b)
+        y_s = _hauteur_arc(y0, v0, sommet, gravite)
+        y_min, y_max = np.minimum(y_min, y_s), np.maximum(y_max, y_s)
+    return y_min, y_max
+
+def collision_balayee(y0, v0, n, x0, haut, bas, gravite=GRAVITE, vitesse_tuyaux=VITESSE_TUYAUX,
+                      bird_x=BIRD_X, rayon=RAYON, hauteur=HAUTEUR, largeur_tuyau=LARGEUR_TUYAU):
+    """Collision continue pendant n frames sans saut. y0 / v0 : oiseaux au début
+    du pas (v0 avant la première gravité, SAUT juste après un saut) ; x0 :
+    tuyau (haut, bas) au début du pas. Tableau bool (même forme que y0) ; ne
+    manque aucune collision d'une simulation frame par frame (test conservateur
+    entre deux frames)"""
+    y0 = np.asarray(y0, dtype=np.float64)
+    v0 = np.asarray(v0, dtype=np.float64)
+    y_min, y_max = _extremes_arc(y0, v0, 0.0, float(n), gravite)
+    mort = (y_min < rayon) | (y_max > hauteur - rayon)
+
+    # Frames (réelles) pendant lesquelles le tuyau est dans la colonne
+    gauche, droite = bird_x - rayon - largeur_tuyau, bird_x + rayon
+    if vitesse_tuyaux == 0:
+        if not gauche < x0 < droite:
+            return mort
+        s_a, s_b = 0.0, float(n)
+    else:
+        ta, tb = (x0 - droite) / vitesse_tuyaux, (x0 - gauche) / vitesse_tuyaux
+        s_a, s_b = max(0.0, min(ta, tb)), min(float(n), max(ta, tb))
+        if s_a >= s_b:
+            return mort
+
+    y_min, y_max = _extremes_arc(y0, v0, s_a, s_b, gravite)
+    mort |= (y_min - rayon < haut) | (y_max + rayon > bas)
+    return mort
+
+def collision_balayee_tuyaux(y0, v0, n, tuyaux, **kwargs):
+    """collision_balayee contre tous les tuyaux d'une FileTuyaux (positions au
+    début du pas). Un tuyau qui apparaît pendant le pas (x = LARGEUR) ne peut
+    atteindre la colonne qu'après ~175 frames : n doit rester en dessous"""
+    mort = None
+    for x, haut, bas in tuyaux.tuyaux():
+        m = collision_balayee(y0, v0, n, x, haut, bas, **kwargs)
+        mort = m if mort is None else mort | m
+    return mort
+
+# =============================================================================
+# === Vérification contre la simulation frame par frame ===
+# =============================================================================
+def _reference(y, v, n, x0, haut, bas):
+    """Mort pendant l'arc, frame par frame, comme Bot.update"""
+    for k in range(1, n + 1):
+        v += GRAVITE
+        y += v
+        x = x0 - VITESSE_TUYAUX * k
+        if y - RAYON < 0 or y + RAYON > HAUTEUR:
+            return True
+        if BIRD_X + RAYON > x and BIRD_X - RAYON < x + LARGEUR_TUYAU:
+            if y - RAYON < haut or y + RAYON > bas:
+                return True
+    return False
+
+def verifier(essais=20000, seed=0):
+    """Arcs de saut réels (v0 = SAUT ou arc déjà entamé) : aucune collision manquée ;
+    renvoie la part de collisions signalées en plus (entre deux frames)"""
+    rng = np.random.default_rng(seed)
+    # Sommet de l'arc (y = 240) dans le tuyau, fin du pas (y = 308) hors du tuyau : touché
+    assert collision_balayee([300.0], [SAUT], 32, 40, 260, 410, vitesse_tuyaux=0)[0]
+    manques = en_plus = 0
+    for _ in range(essais):
+        n = int(rng.integers(1, 60))
+        y0 = float(rng.uniform(RAYON, HAUTEUR - RAYON))
+        v0 = float(SAUT + GRAVITE * rng.integers(0, 40)) if rng.random() < 0.5 else float(SAUT)
+        x0 = float(rng.integers(-80, 250))
+        haut = float(rng.integers(80, 381))
+        ref = _reference(y0, v0, n, x0, haut, haut + 150)
+        got = bool(collision_balayee([y0], [v0], n, x0, haut, haut + 150)[0])
+        manques += ref and not got
+        en_plus += got and not ref
+    assert manques == 0, f"{manques} collisions manquées"
+    return en_plus / essais
+
+if __name__ == "__main__":
+    print(f"collision_balayee : 0 collision manquée, {verifier():.2%} signalées en plus (entre deux frames)")
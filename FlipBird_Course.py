@@ -0,0 +1,62 @@
+"""
+Parcours de tuyaux déterministe (seed) partagé entre évaluations
+- Les hauteurs de trou sont tirées une seule fois depuis la seed, puis gardées
+  en cache (array compact), générées par blocs à la demande
+- Chaque partie lit le parcours avec son propre Lecteur (index local) :
+  deux oiseaux / générations / politiques voient exactement les mêmes tuyaux
+- Un Course se sérialise (pickle) avec son cache et l'état du rng : une copie
+  envoyée à un autre processus produit la même suite
+"""
+
+import random
+from array import array
+
+TAILLE_BLOC = 256  # hauteurs générées d'un coup quand le cache est épuisé
+
+# =============================================================================
+# === Parcours ===
+# =============================================================================
+class Course:
+    def __init__(self, seed=None, h_min=80, h_max=380):
+        """h_min / h_max : bornes incluses de random.randint (haut du trou)"""
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.h_min = h_min
+        self.h_max = h_max
+        self.hauteurs = array("h")
+        self._rng = random.Random(self.seed)
+
+    def __len__(self):
+        return len(self.hauteurs)
+
+    def pregenerer(self, n):
+        """Génère (si besoin) les n premières hauteurs"""
+        manque = n - len(self.hauteurs)
+        if manque > 0:
+            randint = self._rng.randint
+            self.hauteurs.extend(randint(self.h_min, self.h_max) for _ in range(manque))
+        return self
+
+    def hauteur(self, i):
+        if i >= len(self.hauteurs):
+            self.pregenerer(i + TAILLE_BLOC)
+        return self.hauteurs[i]
+
+    def lecteur(self):
+        return Lecteur(self)
+
+# =============================================================================
+# === Lecture séquentielle d'un parcours ===
+# =============================================================================
+class Lecteur:
+    def __init__(self, course):
+        self.course = course
+        self.index = 0
+
+    def suivant(self):
+        """Hauteur du prochain tuyau du parcours"""
+        hauteurs = self.course.hauteurs
+        i = self.index
+        self.index = i + 1
+        if i < len(hauteurs):
+            return hauteurs[i]
+        return self.course.hauteur(i)
@@ -0,0 +1,233 @@
+"""
+DQN model and agent (PyTorch), shared by the pygame game and the headless trainer
+- No pygame import: usable on servers without a display
+- Agent.save writes the policy weights only (dqn.pth, as before)
+- Agent.save_checkpoint / load_checkpoint write everything needed to resume
+  training exactly (networks, optimizer, eps, steps, replay, RNG states),
+  atomically (temporary file + os.replace)
+- CPU mode: intra-op thread count, optional bfloat16 autocast, fused target,
+  updates/sec measured by the agent
+"""
+
+import os, random, time
+import numpy as np
+from FlipBird_Replay import ReplayBuffer, PrioritizedReplayBuffer
+from FlipBird_EnvRL import STATE_DIM, ACTION_DIM, collect
+
+# Attempt to import torch (PyTorch)
+try:
+    import torch
+    import torch.nn as nn
+    import torch.optim as optim
+    TORCH_AVAILABLE = True
+except Exception as e:
+    TORCH_AVAILABLE = False
+    print("Torch not available. Install torch to run RL: pip install torch")
+
+MODEL_PATH = "dqn.pth"
+
+# DQN hyperparams
+HIDDEN = 128
+GAMMA = 0.99
+LR = 1e-3
+BATCH_SIZE = 64
+BUFFER_SIZE = 50000
+MIN_REPLAY = 500
+EPS_START = 1.0
+EPS_END = 0.02
+EPS_DECAY = 0.9995  # multiplicative decay per step
+TARGET_UPDATE_FREQ = 1000  # steps
+
+# Prioritized experience replay (sum-tree): replays rare death / pipe-pass transitions more often
+PRIORITIZED_REPLAY = False
+PER_ALPHA = 0.6        # 0 = uniform, 1 = fully proportional to |TD error|
+PER_BETA_START = 0.4   # importance-sampling correction, annealed to 1
+PER_BETA_STEPS = 100000
+
+# CPU performance mode (no GPU on the training hosts)
+# A 4-128-128-2 MLP on batches of 64 is dominated by per-op overhead: 1-4 threads is
+# usually faster than one per core, measure with FlipBird_RL_Train --threads N
+CPU_THREADS = None  # torch intra-op threads (None = torch default, one per core)
+BF16 = False        # bfloat16 autocast (only pays off on CPUs with native bf16: AVX512-BF16 / AMX)
+
+def save_atomic(obj, path):
+    """torch.save to a temporary file next to path, then rename over it"""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        torch.save(obj, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+if TORCH_AVAILABLE:
+    class DQN(nn.Module):
+        def __init__(self, input_dim, hidden_dim, output_dim):
+            super().__init__()
+            self.net = nn.Sequential(
+                nn.Linear(input_dim, hidden_dim),
+                nn.ReLU(),
+                nn.Linear(hidden_dim, hidden_dim),
+                nn.ReLU(),
+                nn.Linear(hidden_dim, output_dim)
+            )
+        def forward(self, x):
+            return self.net(x)
+
+    class Agent:
+        def __init__(self, state_dim=STATE_DIM, action_dim=ACTION_DIM, prioritized=PRIORITIZED_REPLAY, seed=None,
+                     cpu_threads=CPU_THREADS, bf16=BF16):
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            if self.device.type == "cpu" and cpu_threads:
+                torch.set_num_threads(cpu_threads)
+            self.bf16 = bf16
+            self.policy = DQN(state_dim, HIDDEN, action_dim).to(self.device)
+            self.target = DQN(state_dim, HIDDEN, action_dim).to(self.device)
+            self.target.load_state_dict(self.policy.state_dict())
+            self.optimizer = optim.Adam(self.policy.parameters(), lr=LR)
+            self.prioritized = prioritized
+            if prioritized:
+                self.replay = PrioritizedReplayBuffer(BUFFER_SIZE, state_dim, BATCH_SIZE, alpha=PER_ALPHA, seed=seed)
+            else:
+                self.replay = ReplayBuffer(BUFFER_SIZE, state_dim, BATCH_SIZE, seed=seed)
+            self.rng = np.random.default_rng(seed)
+            self.steps = 0
+            self.eps = EPS_START
+            self.train_time = 0.0  # seconds spent in replay_train updates (this process)
+            self.train_updates = 0
+
+        def _autocast(self):
+            return torch.autocast(self.device.type, dtype=torch.bfloat16, enabled=self.bf16)
+
+        def updates_per_sec(self):
+            return self.train_updates / self.train_time if self.train_time > 0 else 0.0
+
+        def select_action(self, state, training=True):
+            # state: numpy array
+            if training and random.random() < self.eps:
+                return random.randint(0, ACTION_DIM-1)
+            s = torch.FloatTensor(state).unsqueeze(0).to(self.device)
+            with torch.no_grad():
+                q = self.policy(s)
+            return int(torch.argmax(q).item())
+
+        def select_actions(self, states, training=True):
+            """Epsilon-greedy actions for K states with a single forward pass"""
+            s = torch.from_numpy(states).to(self.device)
+            with torch.no_grad(), self._autocast():
+                actions = self.policy(s).argmax(1).cpu().numpy()
+            if training:
+                explore = self.rng.random(len(actions)) < self.eps
+                actions[explore] = self.rng.integers(0, ACTION_DIM, size=int(explore.sum()))
+            return actions
+
+        def remember(self, s, a, r, s2, done):
+            self.replay.push(s, a, r, s2, done)
+
+        def remember_batch(self, s, a, r, s2, done):
+            self.replay.push_batch(s, a, r, s2, done)
+
+        def replay_train(self):
+            if len(self.replay) < MIN_REPLAY:
+                return 0.0
+            t0 = time.perf_counter()
+            if self.prioritized:
+                beta = min(1.0, PER_BETA_START + (1.0 - PER_BETA_START) * self.steps / PER_BETA_STEPS)
+                batch, weights, idx = self.replay.sample_prioritized(BATCH_SIZE, beta)
+            else:
+                batch = self.replay.sample(BATCH_SIZE)
+            # Zero-copy views on the replay batch arrays (copied only if device is GPU)
+            s, a, r, s2, done = (torch.from_numpy(x).to(self.device) for x in batch)
+            a = a.unsqueeze(1)
+
+            with self._autocast():
+                q_vals = self.policy(s).gather(1, a).squeeze(1).float()
+                with torch.no_grad():
+                    q_next = self.target(s2).max(1)[0].float()
+            # Fused target: r + GAMMA * (1 - done) * q_next in one op, no autograd graph
+            with torch.no_grad():
+                q_target = torch.addcmul(r, 1.0 - done, q_next, value=GAMMA)
+
+            if self.prioritized:
+                td = q_target - q_vals
+                loss = (torch.from_numpy(weights).to(self.device) * td.pow(2)).mean()
+                self.replay.update_priorities(idx, td.detach().abs().cpu().numpy())
+            else:
+                loss = nn.functional.mse_loss(q_vals, q_target)
+            self.optimizer.zero_grad(set_to_none=True)
+            loss.backward()
+            self.optimizer.step()
+
+            # epsilon decay
+            if self.eps > EPS_END:
+                self.eps *= EPS_DECAY
+            self.steps += 1
+            if self.steps % TARGET_UPDATE_FREQ == 0:
+                self.target.load_state_dict(self.policy.state_dict())
+            loss = loss.item()
+            self.train_time += time.perf_counter() - t0
+            self.train_updates += 1
+            return loss
+
+        def save(self, path=MODEL_PATH):
+            torch.save(self.policy.state_dict(), path)
+
+        def load(self, path=MODEL_PATH):
+            if os.path.exists(path):
+                self.policy.load_state_dict(torch.load(path, map_location=self.device))
+                self.target.load_state_dict(self.policy.state_dict())
+                print("Loaded model from", path)
+                return True
+            return False
+
+        def state_dict(self):
+            return {
+                "policy": self.policy.state_dict(),
+                "target": self.target.state_dict(),
+                "optimizer": self.optimizer.state_dict(),
+                "eps": self.eps,
+                "steps": self.steps,
+                "prioritized": self.prioritized,
+                "replay": self.replay.state_dict(),
+                "rng": self.rng.bit_generator.state,
+                "torch_rng": torch.get_rng_state(),
+                "random_state": random.getstate(),
+            }
+
+        def load_state_dict(self, state):
+            if state["prioritized"] != self.prioritized:
+                raise ValueError("checkpoint prioritized=%s, agent prioritized=%s"
+                                 % (state["prioritized"], self.prioritized))
+            self.policy.load_state_dict(state["policy"])
+            self.target.load_state_dict(state["target"])
+            self.optimizer.load_state_dict(state["optimizer"])
+            self.eps = state["eps"]
+            self.steps = state["steps"]
+            self.replay.load_state_dict(state["replay"])
+            self.rng.bit_generator.state = state["rng"]
+            torch.set_rng_state(state["torch_rng"])
+            random.setstate(state["random_state"])
+
+        def save_checkpoint(self, path, extra=None):
+            """Full training state (+ extra dict, e.g. env state) written atomically"""
+            save_atomic({"agent": self.state_dict(), "extra": extra or {}}, path)
+
+        def load_checkpoint(self, path):
+            """Restore a checkpoint written by save_checkpoint; returns its extra dict"""
+            ckpt = torch.load(path, map_location=self.device, weights_only=False)
+            self.load_state_dict(ckpt["agent"])
+            return ckpt["extra"]
+else:
+    Agent = None
+
+def train_vectorized(agent, env, n_steps):
+    """Collect n_steps * env.n transitions from the vectorized env, one gradient step per vectorized step"""
+    losses = []
+    def on_batch(s, a, r, s2, done):
+        agent.remember_batch(s, a, r, s2, done)
+        loss = agent.replay_train()
+        if loss:
+            losses.append(loss)
+    collect(env, agent.select_actions, n_steps, on_batch)
+    scores = env.finished_scores[:]
+    env.finished_scores.clear()
+    return losses, scores
@@ -0,0 +1,181 @@
+"""
+Vectorized Flappy environments for DQN training (no pygame)
+- K independent games stepped together with NumPy arrays
+- Same physics, pipes, score and state normalization as FlipBird_RL3_torch
+- Pipes are read from a seeded Course: pipe k of an episode sits at
+  x = LARGEUR + ESPACEMENT*k - VITESSE_TUYAUX*t, so the next pipe and the pipe
+  under the bird are found in closed form instead of scanning a list of dicts
+- raw=True gives unnormalized states (y, v, pipe dx, gap centre - y) in float64,
+  for discretizing agents (tabular Q-learning)
+"""
+
+import numpy as np
+
+from FlipBird_Course import Course
+
+# ----------------- Config (same as FlipBird_RL3_torch) -----------------
+LARGEUR, HAUTEUR = 400, 600
+RAYON = 15
+GRAVITE = 0.5
+VITESSE_TUYAUX = 3
+LARGEUR_TUYAU = 60
+ECART = 150
+JUMP_V = -8.0
+ESPACEMENT = 220  # distance between two consecutive pipes
+O_X = 60
+
+STATE_DIM = 4
+ACTION_DIM = 2
+
+# Rewards, shared with FlappyEnv of FlipBird_RL3_torch (imported there)
+REW_PER_FRAME = 0.1
+REW_PASS_PIPE = 50.0
+REW_DEATH = -200.0
+
+COURSE_LEN = 100000  # pipes pre-generated; episodes start at random offsets
+
+class VecFlappyEnv:
+    def __init__(self, n_envs, course=None, seed=None, same_start=False, max_episode_steps=None, raw=False):
+        """same_start: every episode starts at pipe 0 of the course (identical workloads)"""
+        self.n = n_envs
+        self.course = course if course is not None else Course(seed, 80, HAUTEUR - 220)
+        self.rng = np.random.default_rng(seed)
+        self.same_start = same_start
+        self.max_episode_steps = max_episode_steps
+        self.raw = raw
+        self.obs_dtype = np.float64 if raw else np.float32
+        self._load_heights(COURSE_LEN if not same_start else 1024)
+
+        self.y = np.full(n_envs, HAUTEUR / 2.0)
+        self.v = np.zeros(n_envs)
+        self.t = np.zeros(n_envs, dtype=np.int64)
+        self.base = np.zeros(n_envs, dtype=np.int64)
+        self.score = np.zeros(n_envs, dtype=np.int64)
+        self.obs = np.zeros((n_envs, STATE_DIM), dtype=self.obs_dtype)
+        self.finished_scores = []  # scores of completed episodes
+        self.reset()
+
+    def _load_heights(self, n):
+        self.course.pregenerer(n)
+        self.heights = np.frombuffer(self.course.hauteurs, dtype=np.int16).astype(np.float64)
+
+    def _heights(self, idx):
+        if idx.max() >= len(self.heights):
+            self._load_heights(2 * int(idx.max()) + 1)
+        return self.heights[idx]
+
+    def _reset_envs(self, mask):
+        n = int(np.count_nonzero(mask))
+        if n == 0:
+            return
+        self.y[mask] = HAUTEUR / 2.0
+        self.v[mask] = 0.0
+        self.t[mask] = 0
+        self.score[mask] = 0
+        if self.same_start:
+            self.base[mask] = 0
+        else:
+            self.base[mask] = self.rng.integers(0, len(self.heights) // 2, size=n)
+
+    def reset(self):
+        self._reset_envs(np.ones(self.n, dtype=bool))
+        self._observe(self.obs)
+        return self.obs
+
+    def state_dict(self):
+        """Everything needed to continue the same episodes after a restart"""
+        return {
+            "n": self.n, "course_seed": self.course.seed, "course_len": len(self.heights),
+            "rng": self.rng.bit_generator.state,
+            "y": self.y.copy(), "v": self.v.copy(), "t": self.t.copy(),
+            "base": self.base.copy(), "score": self.score.copy(),
+        }
+
+    def load_state_dict(self, state):
+        if state["n"] != self.n or state["course_seed"] != self.course.seed:
+            raise ValueError("env state for %d envs / course %s, got %d envs / course %s"
+                             % (state["n"], state["course_seed"], self.n, self.course.seed))
+        if state["course_len"] > len(self.heights):
+            self._load_heights(state["course_len"])
+        self.rng.bit_generator.state = state["rng"]
+        self.y[:] = state["y"]
+        self.v[:] = state["v"]
+        self.t[:] = state["t"]
+        self.base[:] = state["base"]
+        self.score[:] = state["score"]
+        self._observe(self.obs)
+
+    def _pipe_x(self, k):
+        return LARGEUR + ESPACEMENT * k - VITESSE_TUYAUX * self.t
+
+    def _observe(self, out):
+        """normalize_state(o_y, o_v, get_next_pipe(tuyaux)) for every env"""
+        k = self.score  # next pipe = first pipe not yet passed
+        x = self._pipe_x(k)
+        centre = self._heights(self.base + k) + ECART / 2.0
+        if self.raw:
+            out[:, 0] = self.y
+            out[:, 1] = self.v
+            out[:, 2] = x - O_X
+            out[:, 3] = centre - self.y
+            return out
+        out[:, 0] = self.y / HAUTEUR
+        out[:, 1] = np.tanh(self.v / 15.0)
+        out[:, 2] = np.maximum(0.0, x - O_X) / LARGEUR
+        out[:, 3] = (centre - self.y) / HAUTEUR
+        return out
+
+    def step(self, actions):
+        """Advance all envs one frame.
+
+        Returns (next_states, rewards, dones). next_states are the states reached
+        by this step (terminal states for finished episodes); finished envs are
+        then reset and self.obs holds the states for the next action selection.
+        """
+        actions = np.asarray(actions)
+        self.v = np.where(actions == 1, JUMP_V, self.v)
+        self.v += GRAVITE
+        self.y += self.v
+        self.t += 1
+        scroll = VITESSE_TUYAUX * self.t
+
+        # Pipes passed: pipe k is passed once x_k + LARGEUR_TUYAU < O_X
+        num = O_X - LARGEUR_TUYAU - LARGEUR + scroll
+        passed_total = np.maximum(0, -(-num // ESPACEMENT))
+        passed = passed_total - self.score
+        self.score = passed_total
+
+        # Collision: only the first pipe whose right edge is past the bird's left edge can overlap
+        k = np.maximum(0, (O_X - RAYON - LARGEUR_TUYAU - LARGEUR + scroll) // ESPACEMENT + 1)
+        haut = self._heights(self.base + k)
+        overlap = self._pipe_x(k) < O_X + RAYON
+        dones = ((self.y - RAYON < 0) | (self.y + RAYON > HAUTEUR)
+                 | (overlap & ((self.y - RAYON < haut) | (self.y + RAYON > haut + ECART))))
+
+        rewards = REW_PER_FRAME + REW_PASS_PIPE * passed
+        rewards = np.where(dones, REW_DEATH, rewards).astype(np.float32)
+
+        next_states = self._observe(np.empty((self.n, STATE_DIM), dtype=self.obs_dtype))
+
+        finished = dones
+        if self.max_episode_steps is not None:
+            finished = dones | (self.t >= self.max_episode_steps)
+        if finished.any():
+            self.finished_scores.extend(self.score[finished].tolist())
+            self._reset_envs(finished)
+        self._observe(self.obs)
+        return next_states, rewards, dones
+
+def collect(env, select_actions, n_steps, on_batch=None):
+    """Run n_steps vectorized steps with select_actions(states) -> actions.
+
+    on_batch(s, a, r, s2, done) receives every batch of K transitions.
+    """
+    s = env.obs.copy()
+    for _ in range(n_steps):
+        a = select_actions(s)
+        s2, r, done = env.step(a)
+        if on_batch is not None:
+            on_batch(s, a, r, s2, done)
+        s = env.obs.copy()
+    return env.finished_scores
@@ -1,5 +1,6 @@
 import pygame
 import random
+from FlipBird_Texte import CacheTexte, HUD
 
 # === Paramètres du jeu ===
 LARGEUR, HAUTEUR = 400, 600
@@ -20,6 +21,10 @@ pygame.display.set_caption("Flappy Bird - Manu / GA")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("Arial", 20, bold=True)
 
+# Libellés rendus une seule fois, HUD re-rendu seulement si la valeur change
+cache_texte = CacheTexte()
+hud = HUD(font)
+
 # === Classe Bot (GA) ===
 class Bot:
     def __init__(self, threshold=None):
@@ -79,7 +84,7 @@ def creer_tuyau():
 def draw_button(rect, text, color=(180,180,180)):
     pygame.draw.rect(Ecran, color, rect)
     pygame.draw.rect(Ecran, (0,0,0), rect, 2)
-    label = font.render(text, True, (0,0,0))
+    label = cache_texte.rendu(text, 20, (0,0,0), "Arial", True)
     Ecran.blit(label, (rect.x + 8, rect.y + 5))
 
 # === Jeu Manuel ===
@@ -105,7 +110,7 @@ def play_manual():
             draw_button(resume_btn, "Reprendre")
             draw_button(menu_btn, "Menu")
             draw_button(restart_btn, "Restart")
-            txt = font.render("⏸ Jeu en pause", True, (0,0,0))
+            txt = cache_texte.rendu("⏸ Jeu en pause", 20, (0,0,0), "Arial", True)
             Ecran.blit(txt, (130, 200))
             pygame.display.flip()
             clock.tick(30)
@@ -146,8 +151,7 @@ def play_manual():
 
         pygame.draw.circle(Ecran, (255,220,0), (o_x, int(o_y)), RAYON)
 
-        score_txt = font.render(f"Score: {score}", True, (0,0,0))
-        Ecran.blit(score_txt, (10, 10))
+        hud.dessiner(Ecran, "score", f"Score: {score}", (10, 10))
 
         draw_button(pause_btn, "Pause")
         draw_button(restart_btn, "Restart")
@@ -180,7 +184,7 @@ def play_ga():
                 draw_button(resume_btn, "Reprendre")
                 draw_button(menu_btn, "Menu")
                 draw_button(restart_btn, "Restart")
-                txt = font.render("⏸ GA en pause", True, (0,0,0))
+                txt = cache_texte.rendu("⏸ GA en pause", 20, (0,0,0), "Arial", True)
                 Ecran.blit(txt, (130, 200))
                 pygame.display.flip()
                 clock.tick(30)
@@ -216,8 +220,7 @@ def play_ga():
 
             for bot in population: bot.draw(Ecran)
 
-            gen_txt = font.render(f"Gen {generation} | Alive {sum(b.alive for b in population)} | Best {best_score}", True, (0,0,0))
-            Ecran.blit(gen_txt, (10, 10))
+            hud.dessiner(Ecran, "gen", f"Gen {generation} | Alive {sum(b.alive for b in population)} | Best {best_score}", (10, 10))
 
             draw_button(pause_btn, "Pause")
             draw_button(restart_btn, "Restart")
@@ -2,7 +2,17 @@ import pygame
 import random
 import csv
 import os
+import time
 import matplotlib.pyplot as plt
+from FlipBird_Course import Course
+from FlipBird_Tuyaux import FileTuyaux
+from FlipBird_Collision import Colonne
+from FlipBird_Log import JournalCSV
+from FlipBird_Graph import GraphiqueLive
+from FlipBird_Texte import CacheTexte, HUD
+from FlipBird_Rendu import RenduDirty, RenduPopulation
+from FlipBird_Assets import Assets
+from FlipBird_Audio import MixeurEvenements
 
 # =============================================================================
 # === Paramètres du jeu ===
@@ -41,6 +51,14 @@ BROWN = (100,50,10) #Marron
 POP_SIZE = 30   
 MUTATION_RATE = 0.2
 
+# === Mode turbo (touche T / bouton) : pas de simulation par frame affichée ===
+TURBO_PAS = 8        # valeur initiale, ajustable avec + / -
+TURBO_PAS_MAX = 512
+
+# === Parcours des tuyaux du GA (None = seed aléatoire à chaque lancement) ===
+SEED_COURSE = None
+CACHE_ASSETS = ".cache_assets"  # cache disque des images décodées (None = désactivé)
+
 # =============================================================================
 #==== Initialisation =====
 # =============================================================================
@@ -52,21 +70,22 @@ pygame.display.set_caption("Flappy Bird - Menu Manu / GA")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("Arial", 18, bold=True)
 
+# Textes rendus une seule fois (menus, boutons) et HUD re-rendu si la valeur change
+cache_texte = CacheTexte()
+hud = HUD(font)
+
 # =============================================================================
 # === Images de fond des menus===
 # =============================================================================
+# Décodées une fois, mises à l'échelle et converties au format de l'écran
+assets = Assets(CACHE_ASSETS)
 try:
-    fond_menu = pygame.image.load("Images/montain_nege.jpg")
-    fond_menu = pygame.transform.scale(fond_menu, (LARGEUR, HAUTEUR))
-
-    fond_menu_manu = pygame.image.load("Images/montain_nege.jpg")
-    fond_menu_manu = pygame.transform.scale(fond_menu_manu, (LARGEUR, HAUTEUR))
+    fond_menu = assets.image("Images/montain_nege.jpg", (LARGEUR, HAUTEUR))
+    fond_menu_manu = assets.image("Images/montain_nege.jpg", (LARGEUR, HAUTEUR))  # même surface que fond_menu
 
-    fond_manu = pygame.image.load("Images/paysage_vert.jpg")
-    fond_manu = pygame.transform.scale(fond_manu, (LARGEUR, HAUTEUR))
+    fond_manu = assets.image("Images/paysage_vert.jpg", (LARGEUR, HAUTEUR))
 
-    fond_ga = pygame.image.load("Images/florest_vert.jpg")
-    fond_ga = pygame.transform.scale(fond_ga, (LARGEUR, HAUTEUR))
+    fond_ga = assets.image("Images/florest_vert.jpg", (LARGEUR, HAUTEUR))
 except Exception as e:
     print("⚠️ Erreur chargement fond :", e)
     fond_menu = fond_manu = fond_ga = None
@@ -75,19 +94,24 @@ except Exception as e:
 #Image pour le oiseau
 # =============================================================================
 try:
-    bird_img = pygame.image.load("Images/Bird rose.png").convert_alpha()
-    bird_img = pygame.transform.scale(bird_img, (40, 30))  # ajuste taille
+    bird_img = assets.image("Images/Bird rose.png", (40, 30), alpha=True)  # ajuste taille
 except Exception as e:
     print("⚠️ Erreur chargement oiseau :", e)
     bird_img = None
 
+# Tous les bots du GA dessinés d'un seul Surface.blits
+rendu_oiseaux = RenduPopulation(bird_img, RAYON)
+
 # =============================================================================
 # === AUDIO ===
 # =============================================================================
+# Effets sonores décodés à leur première lecture (pas au lancement)
+son_saut = assets.son("Sound/Mario Jump.mp3")
+son_mort = assets.son("Sound/Fail music.wav")
+son_point = assets.son("Sound/coin.mp3")
+# Sons d'une même frame regroupés, joués sur un pool fixe de canaux
+audio = MixeurEvenements()
 try:
-    son_saut = pygame.mixer.Sound("Sound/Mario Jump.mp3")
-    son_mort = pygame.mixer.Sound("Sound/Fail music.wav")
-    son_point = pygame.mixer.Sound("Sound/coin.mp3")
     pygame.mixer.music.load("Sound/Fond_Music_retro.mp3")
     pygame.mixer.music.play(-1)  # musique en boucle
 except Exception as e:
@@ -106,12 +130,13 @@ history_manu = []
 # =============================================================================
 CSV_GA = "birds_evolution_ga.csv"
 CSV_MANU = "manual_scores.csv"
-for file, header in [(CSV_GA, ["Generation", "Bird_ID", "Score"]),
-                     (CSV_MANU, ["Game", "Score"])]:
-    if not os.path.exists(file):
-        with open(file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(header)
+if not os.path.exists(CSV_MANU):
+    with open(CSV_MANU, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Game", "Score"])
+
+# Journal GA tamponné (fichier ouvert, écrit par paquets et à la sortie)
+journal_ga = JournalCSV(CSV_GA)
 
 # =============================================================================
 # === Classe Bot (GA) ===
@@ -125,7 +150,7 @@ class Bot:
         self.pipes_passed = 0
         self.threshold = threshold if threshold is not None else random.uniform(-50, 50)
 
-    def update(self, tuyaux):
+    def update(self, tuyaux, colonne):
        # if self.x < 60:
         #    self.x  = self.x  - self.v
 
@@ -133,34 +158,21 @@ class Bot:
         self.v += GRAVITE
         self.y += self.v
     #    self.y  = self.y  +  self.v
-        if tuyaux:
-            p = tuyaux[0]
-            centre = (p["haut"] + p["bas"]) / 2
-            if self.y > centre + self.threshold:
-                self.v = SAUT
+        if self.y > tuyaux.centre + self.threshold:
+            self.v = SAUT
         if self.y - RAYON < 0 or self.y + RAYON > HAUTEUR:
             self.alive = False
 
             #Pour le son
             if sound_enabled:
-                try: son_mort.play() # Audio de mort 
-                except: pass
-
-        for t in tuyaux:
-            if (self.x + RAYON > t["x"] and self.x - RAYON < t["x"] + LARGEUR_TUYAU):
-                if self.y - RAYON < t["haut"] or self.y + RAYON > t["bas"]:
-                    self.alive = False
-                    #Pour le bouton de son
-                    if sound_enabled:
-                        try: son_mort.play() # Audio de mort 
-                        except: pass
-    #Image oiseau
-    def draw(self, surface, color=(255,220,0)):
-        if self.alive:
-            if bird_img:
-                surface.blit(bird_img, (self.x - bird_img.get_width()//2, int(self.y) - bird_img.get_height()//2))
-            else:
-                pygame.draw.circle(surface, color, (self.x, int(self.y)), RAYON)
+                audio.jouer(son_mort) # Audio de mort (une seule fois par frame)
+
+        # Seul le tuyau dans la colonne de l'oiseau peut le toucher
+        if colonne.touche(self.y, RAYON):
+            self.alive = False
+            #Pour le bouton de son
+            if sound_enabled:
+                audio.jouer(son_mort) # Audio de mort (une seule fois par frame)
 
 # =============================================================================
 # === Fonctions GA ===
@@ -176,10 +188,7 @@ def next_generation(population, generation):
     best_score = population[0].pipes_passed
     avg_score = sum(b.pipes_passed for b in population) / len(population)
     history_ga.append((generation, best_score, avg_score))
-    with open(CSV_GA, "a", newline="") as f:
-        writer = csv.writer(f)
-        for idx, bot in enumerate(population):
-            writer.writerow([generation, idx, bot.pipes_passed])
+    journal_ga.ajouter_generation(generation, [bot.pipes_passed for bot in population])
     best = population[:POP_SIZE//4]
     new_pop = []
     while len(new_pop) < POP_SIZE:
@@ -188,16 +197,22 @@ def next_generation(population, generation):
     return new_pop
 
 # === Tuyaux ===
-def creer_tuyau():
-    h = random.randint(80, HAUTEUR - 220)
-    return {"x": LARGEUR, "haut": h, "bas": h + ECART, "passed": False}
+# Parcours seedé : chaque génération du GA relit les mêmes tuyaux
+# (le mode manuel tire un nouveau parcours à chaque partie)
+course = Course(SEED_COURSE, 80, HAUTEUR - 220)
+
+def creer_tuyaux(lecteur):
+    """File circulaire des tuyaux d'une partie (FlipBird_Tuyaux), premier tuyau en x = LARGEUR"""
+    return FileTuyaux(lecteur, LARGEUR, VITESSE_TUYAUX, LARGEUR_TUYAU, ECART)
+
+# Index du tuyau qui chevauche la colonne de l'oiseau (x = 60), mis à jour par frame
+colonne = Colonne(60, RAYON, LARGEUR_TUYAU)
 
 # =============================================================================
 # Fonction auxilaire pour dessiner du texte dans le menu principal
 # =============================================================================
 def draw_text(text, size, x, y, color=WHITE, centered=True):
-    font = pygame.font.SysFont(None, size)
-    text_surface = font.render(text, True, color)
+    text_surface = cache_texte.rendu(text, size, color)
     if centered:
         text_rect = text_surface.get_rect(center=(x, y))
     else:
@@ -244,18 +259,10 @@ def update_graph_manu():
     plt.title("Evolution du score (Manuel)")
     plt.show()
 
-def update_graph_ga_live():
-    plt.clf()
-    gens = [g for g, _, _ in history_ga]
-    bests = [b for _, b, _ in history_ga]
-    avgs = [a for _, _, a in history_ga]
-    plt.plot(gens, bests, label="Best Score", color="red")
-    plt.plot(gens, avgs, label="Avg Score", color="blue")
-    plt.xlabel("Generations")
-    plt.ylabel("Score (pipes passed)")
-    plt.legend()
-    plt.title("Evolution des birds (GA)")
-    plt.pause(0.01)
+def update_graph_ga_live(graph):
+    # Envoie seulement le dernier point : le processus graphique garde l'historique
+    generation, best_score, avg_score = history_ga[-1]
+    graph.ajouter(generation, best_score, avg_score)
 
 # =============================================================================
 # === Dessin boutons ===
@@ -265,7 +272,7 @@ def draw_game_buttons(buttons):
     for btn, text in buttons:
         color = (180,180,250) if btn.collidepoint(mouse_pos) else (200,200,200)
         pygame.draw.rect(Ecran, color, btn)
-        Ecran.blit(font.render(text, True, (0,0,0)), (btn.x + 10, btn.y + 5))
+        Ecran.blit(cache_texte.rendu(text, 18, (0,0,0), "Arial", True), (btn.x + 10, btn.y + 5))
 
 # =============================================================================
 # === Menu avant le mode manuel ===
@@ -319,9 +326,11 @@ def play_manual():
     while True:
         game = len(history_manu) + 1
         o_x, o_y, o_v = 60, HAUTEUR//2, 0
-        tuyaux = [creer_tuyau()]
+        tuyaux = creer_tuyaux(Course(None, 80, HAUTEUR - 220).lecteur())
         score = 0
         running = True
+        # Rendu dirty rects : seul ce qui bouge est redessiné / envoyé à l'écran
+        rendu = RenduDirty(Ecran, fond_manu if fond_manu else (135,206,250))
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT: return "quit"
@@ -329,61 +338,48 @@ def play_manual():
                     o_v = SAUT
                     # Quand l’oiseau saute
                     if sound_enabled:
-                        try: 
-                         son_saut.play() #Audio de Saut
-                        except: pass
+                        audio.jouer(son_saut) #Audio de Saut
                     
             o_v += GRAVITE
             o_y += o_v
-            for t in tuyaux: t["x"] -= VITESSE_TUYAUX
-            if tuyaux[0]["x"] < -LARGEUR_TUYAU: tuyaux.pop(0)
-            if tuyaux[-1]["x"] < LARGEUR - 200: tuyaux.append(creer_tuyau())
-            for t in tuyaux:
-                if not t["passed"] and t["x"] + LARGEUR_TUYAU < o_x:
-                    t["passed"] = True
-                    score += 1
-                    # Quand on marque un point
-                    if sound_enabled:
-                        try: son_point.play() # Audio de point
-                        except: pass
+            points = tuyaux.avancer()
+            if points:
+                score += points
+                # Quand on marque un point
+                if sound_enabled:
+                    audio.jouer(son_point) # Audio de point
 
             collision = False
             if o_y - RAYON < 0 or o_y + RAYON > HAUTEUR: collision = True
-            for t in tuyaux:
-                if (o_x+RAYON > t["x"] and o_x-RAYON < t["x"]+LARGEUR_TUYAU):
-                    if o_y-RAYON < t["haut"] or o_y+RAYON > t["bas"]: collision = True
+            colonne.maj(tuyaux)
+            if colonne.touche(o_y, RAYON): collision = True
 
-            #Image de fond
-            if fond_manu:
-                Ecran.blit(fond_manu, (0,0))
-            else:
-                Ecran.fill((135,206,250))
+            #Image de fond (seulement sous les objets de la frame précédente)
+            rendu.debut_frame()
 
             # Coleurs du tuyaux par niveau
             couleur_tuyau = get_pipe_color_by_score(score)
 
-            for t in tuyaux:
-                pygame.draw.rect(Ecran, (couleur_tuyau), (t["x"], 0, LARGEUR_TUYAU, t["haut"]))
-                pygame.draw.rect(Ecran, (couleur_tuyau), (t["x"], t["bas"], LARGEUR_TUYAU, HAUTEUR-t["bas"]))
+            for x, haut, bas in tuyaux.tuyaux():
+                rendu.ajouter(pygame.draw.rect(Ecran, (couleur_tuyau), (x, 0, LARGEUR_TUYAU, haut)))
+                rendu.ajouter(pygame.draw.rect(Ecran, (couleur_tuyau), (x, bas, LARGEUR_TUYAU, HAUTEUR-bas)))
 
             #Image oiseau   
             if bird_img:
-                Ecran.blit(bird_img, (o_x - bird_img.get_width()//2, int(o_y) - bird_img.get_height()//2))
+                rendu.ajouter(Ecran.blit(bird_img, (o_x - bird_img.get_width()//2, int(o_y) - bird_img.get_height()//2)))
             else:
-                pygame.draw.circle(Ecran, (255,220,0), (o_x, int(o_y)), RAYON)
+                rendu.ajouter(pygame.draw.circle(Ecran, (255,220,0), (o_x, int(o_y)), RAYON))
 
-            draw_text("Mode Manuel", 30, LARGEUR//2, 20, (0, 0, 0)) #Test noir
-            score_txt = font.render(f"Score: {score}", True, (BLACK)) #Noir = (0,0,0)
-            Ecran.blit(score_txt, (10, 10))
-            pygame.display.flip()
+            rendu.ajouter(draw_text("Mode Manuel", 30, LARGEUR//2, 20, (0, 0, 0))) #Test noir
+            rendu.ajouter(hud.dessiner(Ecran, "score_manu", f"Score: {score}", (10, 10), BLACK)) #Noir = (0,0,0)
+            rendu.fin_frame()
             clock.tick(60)
             if collision: 
                 # Quand on perd
                 if sound_enabled:
-                    try: 
-                        son_mort.play() #Audio de mort
-                    except: pass
+                    audio.jouer(son_mort) #Audio de mort
                 running = False
+            audio.fin_frame()
 
         history_manu.append((game, score))
         with open(CSV_MANU, "a", newline="") as f:
@@ -413,96 +409,122 @@ def ga_post_stop_menu():
         pygame.display.flip()
         clock.tick(30)
 
+# =============================================================================
+# === Un pas de simulation GA (tuyaux, score, bots) ===
+# =============================================================================
+def avancer_ga(population, tuyaux):
+    # Déplacement tuyaux + calcul score
+    for _ in range(tuyaux.avancer()):
+        for bot in population:
+            if bot.alive: bot.pipes_passed += 1
+
+        # Quand on marque un point (un seul son pour toute la population)
+        if sound_enabled:
+            audio.jouer(son_point) # Audio de point
+
+    colonne.maj(tuyaux)
+    for bot in population: bot.update(tuyaux, colonne)
+
 # =============================================================================
 # === Jeu GA avec Stop/Menu et post-stop menu ===
 # =============================================================================
 def play_ga():
     while True:
         population = [Bot() for _ in range(POP_SIZE)]
-        tuyaux = [creer_tuyau()]
-        plt.ion()
-        plt.figure(figsize=(6,4))
+        tuyaux = creer_tuyaux(course.lecteur())
+        graph_ga = GraphiqueLive()
         generation = 0
         stop_btn = pygame.Rect(400, 10, 80, 30)
         menu_btn = pygame.Rect(500, 10, 80, 30)
+        turbo_btn = pygame.Rect(300, 10, 90, 30)
+        # Rendu dirty rects : seul ce qui bouge est redessiné / envoyé à l'écran
+        rendu = RenduDirty(Ecran, fond_ga if fond_ga else (135,206,250))
+
+        # Mode turbo : plusieurs pas de simulation par frame affichée
+        turbo = False
+        pas_turbo = TURBO_PAS
+        t_mesure, pas_mesure, pas_par_sec = time.perf_counter(), 0, 0.0
 
         # Sauvegarde de la génération initiale
         population = next_generation(population, generation)  
-        update_graph_ga_live() 
+        update_graph_ga_live(graph_ga) 
 
         while True:
             generation += 1
             while any(bot.alive for bot in population):
                 for event in pygame.event.get():
-                    if event.type == pygame.QUIT: plt.ioff(); plt.show(); return "quit"
+                    if event.type == pygame.QUIT: graph_ga.close(); return "quit"
                     if event.type == pygame.MOUSEBUTTONDOWN:
                         if stop_btn.collidepoint(event.pos):
                             choice = ga_post_stop_menu()
+                            rendu.invalider()  # le menu a recouvert tout l'écran
                             if choice == "restart":
                                 # Restart GA depuis zéro
                                 generation = 0
                                 population = [Bot() for _ in range(POP_SIZE)]
-                                tuyaux = [creer_tuyau()]
+                                tuyaux.reset(course.lecteur())
                                 history_ga.clear()
-                                plt.clf()
+                                graph_ga.reset()
+                                audio.vider()
                                 break
                             elif choice == "continue":
                                 # Continuer la partie en cours
                                 continue
                             elif choice == "menu":
+                                graph_ga.close()
                                 return "menu"
-                        if menu_btn.collidepoint(event.pos): return "menu"
-
-                # Déplacement tuyaux
-                for t in tuyaux: t["x"] -= VITESSE_TUYAUX
-                if tuyaux[0]["x"] < -LARGEUR_TUYAU: tuyaux.pop(0)
-                if tuyaux[-1]["x"] < LARGEUR - 200: tuyaux.append(creer_tuyau())
-
-                # Calcul score
-                for t in tuyaux:
-                    if not t["passed"] and t["x"] + LARGEUR_TUYAU < 60:
-                        t["passed"] = True
-                        for bot in population:
-                            if bot.alive: bot.pipes_passed += 1
-
-                            # Quand on marque un point
-                            if sound_enabled:
-                                try: 
-                                    son_point.play() # Audio de point
-                                except: pass
-
-                for bot in population: bot.update(tuyaux)
-
-                #Image de fond
-                if fond_ga:
-                    Ecran.blit(fond_ga, (0,0))
-                else:
-                    Ecran.fill((135,206,250))
+                        if menu_btn.collidepoint(event.pos): graph_ga.close(); return "menu"
+                        if turbo_btn.collidepoint(event.pos): turbo = not turbo
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_t: turbo = not turbo
+                        if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                            pas_turbo = min(pas_turbo * 2, TURBO_PAS_MAX)
+                        if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                            pas_turbo = max(pas_turbo // 2, 1)
+
+                # Simulation : 1 pas par frame, ou pas_turbo pas en mode turbo
+                pas = pas_turbo if turbo else 1
+                for _ in range(pas):
+                    avancer_ga(population, tuyaux)
+                    pas_mesure += 1
+                    if not any(bot.alive for bot in population): break
+                audio.fin_frame()  # sons des pas simulés regroupés
+
+                # Pas simulés par seconde (mesurés sur ~0.5 s)
+                maintenant = time.perf_counter()
+                if maintenant - t_mesure >= 0.5:
+                    pas_par_sec = pas_mesure / (maintenant - t_mesure)
+                    t_mesure, pas_mesure = maintenant, 0
+
+                #Image de fond (seulement sous les objets de la frame précédente)
+                rendu.debut_frame()
 
                 best_score = max(bot.pipes_passed for bot in population)
                 
                 #Couleur du tuyau par niveau
                 couleur_tuyau = get_pipe_color_by_score(best_score)
 
-                for t in tuyaux:
-                    pygame.draw.rect(Ecran, couleur_tuyau, (t["x"], 0, LARGEUR_TUYAU, t["haut"]))
-                    pygame.draw.rect(Ecran, couleur_tuyau, (t["x"], t["bas"], LARGEUR_TUYAU, HAUTEUR-t["bas"]))
-
-                for bot in population: bot.draw(Ecran)
-                txt = font.render(f"Gen {generation} | Alive {sum(b.alive for b in population)} |  Score {best_score}", True, (BLACK)) #Noir = (0,0,0)
-                
-                Ecran.blit(txt, (10, 10))
-
-                pygame.draw.rect(Ecran, (200,200,200), stop_btn)
-                pygame.draw.rect(Ecran, (200,200,200), menu_btn)
-                Ecran.blit(font.render("Stop", True, (BLACK)), (stop_btn.x+10, stop_btn.y+5)) #Noir = (0,0,0)
-                Ecran.blit(font.render("Menu P", True, (BLACK)), (menu_btn.x+10, menu_btn.y+5)) #Noir = (0,0,0)
-                pygame.display.flip()
+                for x, haut, bas in tuyaux.tuyaux():
+                    rendu.ajouter(pygame.draw.rect(Ecran, couleur_tuyau, (x, 0, LARGEUR_TUYAU, haut)))
+                    rendu.ajouter(pygame.draw.rect(Ecran, couleur_tuyau, (x, bas, LARGEUR_TUYAU, HAUTEUR-bas)))
+
+                rendu.ajouter(rendu_oiseaux.dessiner(Ecran, [(bot.x, bot.y) for bot in population if bot.alive]))
+                rendu.ajouter(hud.dessiner(Ecran, "gen", f"Gen {generation} | Alive {sum(b.alive for b in population)} |  Score {best_score}", (10, 10), BLACK)) #Noir = (0,0,0)
+                mode_txt = f"Turbo x{pas_turbo}" if turbo else "Normal"
+                rendu.ajouter(hud.dessiner(Ecran, "turbo", f"{mode_txt} | {pas_par_sec:.0f} pas/s", (10, 32), BLACK))
+
+                rendu.ajouter(pygame.draw.rect(Ecran, (200,200,200), stop_btn))
+                rendu.ajouter(pygame.draw.rect(Ecran, (200,200,200), menu_btn))
+                rendu.ajouter(pygame.draw.rect(Ecran, (250,200,10) if turbo else (200,200,200), turbo_btn))
+                Ecran.blit(cache_texte.rendu("Turbo", 18, BLACK, "Arial", True), (turbo_btn.x+10, turbo_btn.y+5))
+                Ecran.blit(cache_texte.rendu("Stop", 18, BLACK, "Arial", True), (stop_btn.x+10, stop_btn.y+5)) #Noir = (0,0,0)
+                Ecran.blit(cache_texte.rendu("Menu P", 18, BLACK, "Arial", True), (menu_btn.x+10, menu_btn.y+5)) #Noir = (0,0,0)
+                rendu.fin_frame()
                 clock.tick(60)
 
             population = next_generation(population, generation)
-            update_graph_ga_live()
-            tuyaux = [creer_tuyau()]
+            update_graph_ga_live(graph_ga)
+            tuyaux.reset(course.lecteur())
         
 
 
@@ -570,6 +592,10 @@ if __name__ == "__main__":
             start = manual_start_menu()
             if start=="menu": mode="menu"
             else: mode = play_manual()
-        elif mode=="ga": mode = play_ga()
+            audio.vider()  # pas d'effet de la partie sur le menu
+        elif mode=="ga":
+            mode = play_ga()
+            audio.vider()
         elif mode=="quit": break
+    journal_ga.close()
     pygame.quit()
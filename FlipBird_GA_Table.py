@@ -1,8 +1,8 @@
 import pygame
 import random
-import csv
-import os
-import matplotlib.pyplot as plt
+from FlipBird_Log import JournalCSV
+from FlipBird_Graph import GraphiqueLive
+from FlipBird_Rendu import RenduPopulation
 
 # === Paramètres du jeu ===
 LARGEUR, HAUTEUR = 600, 600
@@ -22,6 +22,7 @@ Ecran = pygame.display.set_mode((LARGEUR, HAUTEUR))
 pygame.display.set_caption("Flappy Bird - GA avec CSV + Graph")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont("Arial", 18, bold=True)
+rendu_oiseaux = RenduPopulation(rayon=RAYON)  # population dessinée en un seul blits
 
 # === Historique pour graphique ===
 history = []  # (gen, best, avg)
@@ -29,18 +30,12 @@ history = []  # (gen, best, avg)
 # === Fichier CSV ===
 CSV_FILE = "birds_evolution_table.csv"
 
-# Création du fichier CSV avec en-tête si absent
-if not os.path.exists(CSV_FILE):
-    with open(CSV_FILE, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Generation", "Bird_ID", "Score"])
+# Journal tamponné (crée l'en-tête si absent, garde le fichier ouvert)
+journal = JournalCSV(CSV_FILE)
 
 def save_generation(population, generation):
     """Sauvegarde tous les oiseaux d'une génération dans le CSV"""
-    with open(CSV_FILE, "a", newline="") as f:
-        writer = csv.writer(f)
-        for idx, bot in enumerate(population):
-            writer.writerow([generation, idx, bot.pipes_passed])
+    journal.ajouter_generation(generation, [bot.pipes_passed for bot in population])
 
 # === Classe Bot (GA) ===
 class Bot:
@@ -71,10 +66,6 @@ class Bot:
                 if self.y - RAYON < t["haut"] or self.y + RAYON > t["bas"]:
                     self.alive = False
 
-    def draw(self, surface, color=(255,220,0)):
-        if self.alive:
-            pygame.draw.circle(surface, color, (self.x, int(self.y)), RAYON)
-
 # === Fonctions GA ===
 def crossover(p1, p2):
     child_threshold = (p1.threshold + p2.threshold) / 2
@@ -104,18 +95,10 @@ def creer_tuyau():
     return {"x": LARGEUR, "haut": h, "bas": h + ECART, "passed": False}
 
 # === Graphique en live ===
-def update_graph():
-    plt.clf()
-    gens = [g for g, _, _ in history]
-    bests = [b for _, b, _ in history]
-    avgs = [a for _, _, a in history]
-    plt.plot(gens, bests, label="Best Score", color="red")
-    plt.plot(gens, avgs, label="Avg Score", color="blue")
-    plt.xlabel("Generations")
-    plt.ylabel("Score (pipes passed)")
-    plt.legend()
-    plt.title("Evolution des birds (GA)")
-    plt.pause(0.01)
+def update_graph(graph):
+    # Graphique dans un processus séparé : on n'envoie que le dernier point
+    generation, best_score, avg_score = history[-1]
+    graph.ajouter(generation, best_score, avg_score)
 
 # === Jeu GA ===
 def play_ga():
@@ -123,8 +106,7 @@ def play_ga():
     population = [Bot() for _ in range(POP_SIZE)]
     tuyaux = [creer_tuyau()]
 
-    plt.ion()  # mode interactif matplotlib
-    plt.figure(figsize=(6,4))
+    graph = GraphiqueLive()  # processus graphique non bloquant
 
     while True:
         generation += 1
@@ -132,8 +114,7 @@ def play_ga():
         while any(bot.alive for bot in population):
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    plt.ioff()
-                    plt.show()
+                    graph.close()
                     return "quit"
 
             # Tuyaux
@@ -161,7 +142,7 @@ def play_ga():
                 pygame.draw.rect(Ecran, couleur_tuyau, (t["x"], 0, LARGEUR_TUYAU, t["haut"]))
                 pygame.draw.rect(Ecran, couleur_tuyau, (t["x"], t["bas"], LARGEUR_TUYAU, HAUTEUR-t["bas"]))
 
-            for bot in population: bot.draw(Ecran)
+            rendu_oiseaux.dessiner(Ecran, [(bot.x, bot.y) for bot in population if bot.alive])
 
             gen_txt = font.render(f"Gen {generation} | Alive {sum(b.alive for b in population)} | Best {best_score}", True, (0,0,0))
             Ecran.blit(gen_txt, (10, 10))
@@ -171,10 +152,11 @@ def play_ga():
 
         # Nouvelle génération
         population = next_generation(population, generation)
-        update_graph()
+        update_graph(graph)
         tuyaux = [creer_tuyau()]
 
 # === Lancement ===
 if __name__ == "__main__":
     play_ga()
+    journal.close()
     pygame.quit()
@@ -0,0 +1,151 @@
+"""
+Graphique GA en direct, hors de la boucle pygame
+- Le graphique tourne dans un processus séparé (python FlipBird_Graph.py)
+  alimenté ligne par ligne par un pipe : le jeu n'attend jamais matplotlib
+- Les courbes Best / Avg sont des artistes persistants, les points sont ajoutés
+  dans des tableaux préalloués, et le redessin est limité à FPS_GRAPH par seconde
+- À la fermeture du jeu, la fenêtre reste ouverte avec l'historique complet
+"""
+
+import argparse
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+FPS_GRAPH = 2.0  # redessins max par seconde
+
+# =============================================================================
+# === Côté jeu : envoi des points ===
+# =============================================================================
+class GraphiqueLive:
+    def __init__(self, titre="Evolution des birds (GA)", fps=FPS_GRAPH):
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, __file__, "--titre", titre, "--fps", str(fps)],
+                stdin=subprocess.PIPE, text=True, bufsize=1)
+        except OSError as e:
+            print("⚠️ Graphique non lancé :", e)
+            self.process = None
+
+    def _envoyer(self, ligne):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.write(ligne + "\n")
+        except (BrokenPipeError, OSError, ValueError):
+            # Fenêtre fermée ou processus mort : on continue sans graphique
+            self.process = None
+
+    def ajouter(self, generation, best, avg):
+        self._envoyer(f"P {generation} {best} {avg}")
+
+    def reset(self):
+        self._envoyer("R")
+
+    def close(self):
+        """Fin du flux ; la fenêtre reste affichée jusqu'à sa fermeture"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        self.process = None
+
+# =============================================================================
+# === Côté graphique (processus séparé) ===
+# =============================================================================
+class _Series:
+    """Tableaux numpy agrandis par doublement : ajout en O(1) amorti"""
+    def __init__(self, np):
+        self.np = np
+        self.n = 0
+        self.data = np.empty((3, 256), dtype=np.float64)
+
+    def ajouter(self, g, b, a):
+        if self.n == self.data.shape[1]:
+            self.data = self.np.concatenate([self.data, self.np.empty_like(self.data)], axis=1)
+        self.data[:, self.n] = (g, b, a)
+        self.n += 1
+
+    def vues(self):
+        return self.data[0, :self.n], self.data[1, :self.n], self.data[2, :self.n]
+
+def _lire_entree(flux, q):
+    for ligne in flux:
+        q.put(ligne.split())
+    q.put(None)  # EOF : le jeu est fermé
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--titre", default="Evolution des birds (GA)")
+    parser.add_argument("--fps", type=float, default=FPS_GRAPH)
+    args = parser.parse_args()
+
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    q = queue.Queue()
+    threading.Thread(target=_lire_entree, args=(sys.stdin, q), daemon=True).start()
+
+    plt.ion()
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ligne_best, = ax.plot([], [], label="Best Score", color="red")
+    ligne_avg, = ax.plot([], [], label="Avg Score", color="blue")
+    ax.set_xlabel("Generations")
+    ax.set_ylabel("Score (pipes passed)")
+    ax.legend()
+    ax.set_title(args.titre)
+    fig.canvas.draw_idle()
+
+    series = _Series(np)
+    periode = 1.0 / args.fps
+    dernier_dessin = 0.0
+    a_jour = True
+    fini = False
+
+    def dessiner():
+        gens, bests, avgs = series.vues()
+        ligne_best.set_data(gens, bests)
+        ligne_avg.set_data(gens, avgs)
+        ax.relim()
+        ax.autoscale_view()
+        fig.canvas.draw_idle()
+
+    while not fini:
+        # Vide tout ce qui est arrivé depuis le dernier tour
+        while True:
+            try:
+                msg = q.get_nowait()
+            except queue.Empty:
+                break
+            if msg is None:
+                fini = True
+                break
+            if msg[0] == "P":
+                series.ajouter(float(msg[1]), float(msg[2]), float(msg[3]))
+                a_jour = False
+            elif msg[0] == "R":
+                series = _Series(np)
+                a_jour = False
+
+        fenetre_ouverte = plt.fignum_exists(fig.number)
+        maintenant = time.monotonic()
+        if fenetre_ouverte and not a_jour and maintenant - dernier_dessin >= periode:
+            dessiner()
+            dernier_dessin = maintenant
+            a_jour = True
+        if fenetre_ouverte:
+            fig.canvas.start_event_loop(0.05)
+        else:
+            time.sleep(0.05)
+
+    if plt.fignum_exists(fig.number):
+        dessiner()
+        plt.ioff()
+        plt.show()
+
+if __name__ == "__main__":
+    main()
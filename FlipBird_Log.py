@@ -0,0 +1,223 @@
+"""
+Journaux d'évolution GA (birds_evolution_*.csv)
+- JournalCSV : fichier gardé ouvert, lignes mises en tampon sur plusieurs
+  générations, écrites quand le tampon est plein, après un délai, et à la sortie
+- En cas de crash on perd au plus le tampon en cours
+- Le format reste Generation, Bird_ID, Score
+- JournalBinaire : même interface, enregistrements binaires de taille fixe
+  (generation, bird, score, threshold) lisibles en memmap par charger_binaire
+- Conversion : python FlipBird_Log.py csv2bin birds_evolution_ga.csv ga.bin
+               python FlipBird_Log.py bin2csv ga.bin birds_evolution_ga.csv
+"""
+
+import argparse
+import atexit
+import csv
+import os
+import time
+
+import numpy as np
+
+ENTETE_GA = ["Generation", "Bird_ID", "Score"]
+
+# Format binaire : en-tête de 16 octets puis enregistrements little-endian
+MAGIC_BIN = b"FLIPBIRD_GA_v1\0\0"
+DTYPE_GA = np.dtype([("generation", "<i4"), ("bird", "<i4"),
+                     ("score", "<i4"), ("threshold", "<f4")])
+
+# =============================================================================
+# === Journal CSV tamponné ===
+# =============================================================================
+class JournalCSV:
+    def __init__(self, path, header=ENTETE_GA, taille_buffer=10000, intervalle=5.0):
+        """taille_buffer : lignes max en mémoire ; intervalle : secondes max entre écritures"""
+        self.path = path
+        self.taille_buffer = taille_buffer
+        self.intervalle = intervalle
+        nouveau = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.f = open(path, "a", newline="")
+        self.writer = csv.writer(self.f)
+        if nouveau:
+            self.writer.writerow(header)
+            self.f.flush()
+        self.buffer = []
+        self.dernier_flush = time.monotonic()
+        atexit.register(self.close)
+
+    def ajouter(self, ligne):
+        self.buffer.append(ligne)
+        self._peut_etre_flush()
+
+    def ajouter_generation(self, generation, scores, thresholds=None):
+        """Une ligne (generation, idx, score) par oiseau (thresholds ignorés en CSV)"""
+        self.buffer.extend([generation, idx, score] for idx, score in enumerate(scores))
+        self._peut_etre_flush()
+
+    def _peut_etre_flush(self):
+        if (len(self.buffer) >= self.taille_buffer
+                or time.monotonic() - self.dernier_flush >= self.intervalle):
+            self.flush()
+
+    def flush(self):
+        if self.f is None:
+            return
+        if self.buffer:
+            self.writer.writerows(self.buffer)
+            self.buffer.clear()
+        self.f.flush()
+        self.dernier_flush = time.monotonic()
+
+    def close(self):
+        if self.f is None:
+            return
+        self.flush()
+        self.f.close()
+        self.f = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# =============================================================================
+# === Journal binaire (colonnes de taille fixe, memmap) ===
+# =============================================================================
+class JournalBinaire:
+    def __init__(self, path, taille_buffer=100000, intervalle=5.0):
+        self.path = path
+        self.taille_buffer = taille_buffer
+        self.intervalle = intervalle
+        nouveau = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not nouveau:
+            _verifier_entete(path)
+            _tronquer_fin(path)
+        self.f = open(path, "ab")
+        if nouveau:
+            self.f.write(MAGIC_BIN)
+            self.f.flush()
+        self.buffer = []
+        self.nb_lignes = 0
+        self.dernier_flush = time.monotonic()
+        atexit.register(self.close)
+
+    def ajouter_generation(self, generation, scores, thresholds=None):
+        n = len(scores)
+        bloc = np.empty(n, dtype=DTYPE_GA)
+        bloc["generation"] = generation
+        bloc["bird"] = np.arange(n)
+        bloc["score"] = scores
+        bloc["threshold"] = np.nan if thresholds is None else thresholds
+        self.buffer.append(bloc)
+        self.nb_lignes += n
+        if (self.nb_lignes >= self.taille_buffer
+                or time.monotonic() - self.dernier_flush >= self.intervalle):
+            self.flush()
+
+    def flush(self):
+        if self.f is None:
+            return
+        if self.buffer:
+            self.f.write(np.concatenate(self.buffer).tobytes())
+            self.buffer.clear()
+            self.nb_lignes = 0
+        self.f.flush()
+        self.dernier_flush = time.monotonic()
+
+    def close(self):
+        if self.f is None:
+            return
+        self.flush()
+        self.f.close()
+        self.f = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _verifier_entete(path):
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC_BIN)) != MAGIC_BIN:
+            raise ValueError(f"{path} n'est pas un journal binaire FlipBird")
+
+def _tronquer_fin(path):
+    """Supprime un enregistrement incomplet en fin de fichier (crash pendant une écriture)"""
+    taille = os.path.getsize(path) - len(MAGIC_BIN)
+    reste = taille % DTYPE_GA.itemsize
+    if reste:
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - reste)
+
+def charger_binaire(path):
+    """Tableau structuré (memmap, lecture seule) de tout l'historique"""
+    _verifier_entete(path)
+    n = (os.path.getsize(path) - len(MAGIC_BIN)) // DTYPE_GA.itemsize
+    if n == 0:
+        return np.empty(0, dtype=DTYPE_GA)
+    return np.memmap(path, dtype=DTYPE_GA, mode="r", offset=len(MAGIC_BIN), shape=(n,))
+
+def resume_generations(data):
+    """(generations, best, avg) par génération, pour les graphiques"""
+    gen = np.asarray(data["generation"])
+    score = np.asarray(data["score"])
+    if len(gen) == 0:
+        return gen, score, score.astype(np.float64)
+    # Les générations sont écrites dans l'ordre : on coupe aux changements
+    debuts = np.flatnonzero(np.r_[True, gen[1:] != gen[:-1]])
+    tailles = np.diff(np.r_[debuts, len(gen)])
+    best = np.maximum.reduceat(score, debuts)
+    avg = np.add.reduceat(score, debuts, dtype=np.float64) / tailles
+    return gen[debuts], best, avg
+
+# =============================================================================
+# === Conversion CSV <-> binaire ===
+# =============================================================================
+def csv_vers_binaire(csv_path, bin_path, taille_bloc=100000):
+    with open(csv_path, newline="") as f, JournalBinaire(bin_path) as journal:
+        reader = csv.reader(f)
+        next(reader, None)  # en-tête
+        lignes = []
+        for ligne in reader:
+            if ligne:
+                lignes.append(ligne)
+            if len(lignes) >= taille_bloc:
+                _ecrire_lignes(journal, lignes)
+                lignes = []
+        if lignes:
+            _ecrire_lignes(journal, lignes)
+
+def _ecrire_lignes(journal, lignes):
+    valeurs = np.array(lignes, dtype=np.int64)
+    bloc = np.empty(len(valeurs), dtype=DTYPE_GA)
+    bloc["generation"] = valeurs[:, 0]
+    bloc["bird"] = valeurs[:, 1]
+    bloc["score"] = valeurs[:, 2]
+    bloc["threshold"] = np.nan
+    journal.buffer.append(bloc)
+    journal.flush()
+
+def binaire_vers_csv(bin_path, csv_path):
+    data = charger_binaire(bin_path)
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(ENTETE_GA)
+        colonnes = np.column_stack([data["generation"], data["bird"], data["score"]])
+        writer.writerows(colonnes.tolist())
+
+def main():
+    parser = argparse.ArgumentParser(description="Conversion des journaux GA")
+    parser.add_argument("sens", choices=["csv2bin", "bin2csv"])
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args()
+    if args.sens == "csv2bin":
+        csv_vers_binaire(args.source, args.destination)
+    else:
+        binaire_vers_csv(args.source, args.destination)
+
+if __name__ == "__main__":
+    main()
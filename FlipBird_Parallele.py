@@ -0,0 +1,61 @@
+"""
+Évaluation parallèle (multiprocessing) des générations GA headless
+- La population est découpée en morceaux, un par processus
+- Chaque processus rejoue le même parcours de tuyaux (copie du Course seedé)
+- Les bots ne s'influencent pas : les scores sont identiques à l'évaluation
+  séquentielle de FlipBird_Sim.jouer_generation
+"""
+
+import multiprocessing
+import os
+
+from FlipBird_Sim import jouer_generation
+
+# =============================================================================
+# === Travail d'un processus ===
+# =============================================================================
+def _evaluer_morceau(moteur, thresholds, course, max_frames):
+    if moteur == "numpy":
+        from FlipBird_SimNumpy import jouer_generation_numpy
+        return jouer_generation_numpy(thresholds, course, max_frames)
+    return jouer_generation(thresholds, course, max_frames)
+
+def decouper(thresholds, n):
+    """Découpe la liste en n morceaux contigus de tailles proches"""
+    n = max(1, min(n, len(thresholds)))
+    taille, reste = divmod(len(thresholds), n)
+    morceaux, debut = [], 0
+    for i in range(n):
+        fin = debut + taille + (1 if i < reste else 0)
+        morceaux.append(thresholds[debut:fin])
+        debut = fin
+    return morceaux
+
+# =============================================================================
+# === Évaluateur (même signature que jouer_generation) ===
+# =============================================================================
+class EvaluateurParallele:
+    def __init__(self, processus=None, moteur="python"):
+        self.processus = processus or os.cpu_count() or 1
+        self.moteur = moteur
+        self.pool = multiprocessing.Pool(self.processus)
+
+    def __call__(self, thresholds, course, max_frames=None):
+        """Évalue une génération ; renvoie les pipes_passed dans l'ordre d'origine"""
+        # course est sérialisé avec son cache et son rng : même parcours partout
+        taches = [(self.moteur, morceau, course, max_frames)
+                  for morceau in decouper(list(thresholds), self.processus)]
+        scores = []
+        for resultat in self.pool.starmap(_evaluer_morceau, taches):
+            scores.extend(resultat)
+        return scores
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,88 @@
+"""
+Inference-only DQN policy (NumPy, no torch at run time)
+- dqn.pth is exported once to dqn.npz (the 4->128->128->2 MLP weights);
+  torch is imported only for that conversion. dqn.npz is shipped with the
+  repo so --play works on a machine without torch
+- PolitiqueNumpy evaluates the MLP with preallocated buffers: no optimizer,
+  no target network, no replay, no autograd, no tensor allocation per frame
+
+Export by hand: python FlipBird_Policy.py dqn.pth dqn.npz
+"""
+
+import os, sys
+import numpy as np
+
+MODEL_PATH = "dqn.pth"
+LAYERS = ("net.0", "net.2", "net.4")  # Linear layers of FlipBird_DQN.DQN
+
+def npz_pour(pth_path):
+    """Export path of a .pth: same name, .npz suffix (dqn.pth -> dqn.npz)"""
+    return os.path.splitext(pth_path)[0] + ".npz"
+
+def exporter_npz(pth_path=MODEL_PATH, npz_path=None):
+    """Convert the policy state_dict to NumPy arrays (weights stored transposed)"""
+    npz_path = npz_path or npz_pour(pth_path)
+    import torch
+    state = torch.load(pth_path, map_location="cpu")
+    arrays = {}
+    for i, name in enumerate(LAYERS):
+        arrays[f"w{i}"] = np.ascontiguousarray(state[name + ".weight"].numpy().T, dtype=np.float32)
+        arrays[f"b{i}"] = state[name + ".bias"].numpy().astype(np.float32)
+    tmp = npz_path + ".tmp.npz"
+    np.savez(tmp, **arrays)
+    os.replace(tmp, npz_path)
+    return npz_path
+
+class PolitiqueNumpy:
+    def __init__(self, pth_path=MODEL_PATH, npz_path=None):
+        """Loads npz_path (default: next to pth_path); re-exports it first if it is
+        missing or older than pth_path. Without torch an existing npz is used as is;
+        ImportError if there is none"""
+        npz_path = npz_path or npz_pour(pth_path)
+        if os.path.exists(pth_path) and (not os.path.exists(npz_path)
+                                         or os.path.getmtime(npz_path) < os.path.getmtime(pth_path)):
+            try:
+                exporter_npz(pth_path, npz_path)
+            except ImportError:
+                if not os.path.exists(npz_path):
+                    raise
+                print(f"Torch not available: using {npz_path} as is (may be older than {pth_path})")
+        with np.load(npz_path) as data:
+            self.w = [data[f"w{i}"] for i in range(len(LAYERS))]
+            self.b = [data[f"b{i}"] for i in range(len(LAYERS))]
+        self.state_dim = self.w[0].shape[0]
+        self._s = np.empty(self.state_dim, dtype=np.float32)
+        self._h = [np.empty(w.shape[1], dtype=np.float32) for w in self.w]
+
+    def q_values(self, state):
+        """Q values of one state, written in a reused buffer"""
+        x = self._s
+        x[:] = state
+        last = len(self.w) - 1
+        for i, (w, b, h) in enumerate(zip(self.w, self.b, self._h)):
+            np.dot(x, w, out=h)
+            h += b
+            if i < last:
+                np.maximum(h, 0.0, out=h)
+            x = h
+        return x
+
+    def action(self, state):
+        q = self.q_values(state)
+        return int(q[1] > q[0]) if len(q) == 2 else int(q.argmax())
+
+    def actions(self, states):
+        """Greedy actions for a batch of states (K, state_dim)"""
+        x = np.asarray(states, dtype=np.float32)
+        last = len(self.w) - 1
+        for i, (w, b) in enumerate(zip(self.w, self.b)):
+            x = x @ w
+            x += b
+            if i < last:
+                np.maximum(x, 0.0, out=x)
+        return x.argmax(1)
+
+if __name__ == "__main__":
+    src = sys.argv[1] if len(sys.argv) > 1 else MODEL_PATH
+    dst = sys.argv[2] if len(sys.argv) > 2 else npz_pour(src)
+    print("Exported", exporter_npz(src, dst))
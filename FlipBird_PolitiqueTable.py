@@ -0,0 +1,151 @@
+"""
+Politique compilée en table de décision
+- Un contrôleur quelconque (règle à seuil, Q-table de RL1, DQN) est évalué une
+  fois sur une grille quantifiée de l'état (y, vitesse, dx, centre du trou)
+- Le résultat est une table dense uint8 : en jeu, une décision = un index de
+  tableau (une valeur ou toute une population d'un coup)
+- La grille est approximative : accord() mesure le taux de décisions
+  identiques au contrôleur d'origine sur des états tirés au hasard
+
+Exemple : python FlipBird_PolitiqueTable.py seuil --seuil 18 --sortie politique_table.npz
+"""
+
+import argparse, time
+import numpy as np
+
+# Axes de la grille : (min, max, pas) — valeurs arrondies au point de grille le plus proche
+GRILLE_DEFAUT = {
+    "y": (0.0, 600.0, 5.0),
+    "v": (-8.0, 24.0, 1.0),
+    "dx": (-60.0, 600.0, 20.0),      # x du prochain tuyau - x de l'oiseau
+    "centre": (155.0, 475.0, 10.0),  # centre du trou (haut + ECART/2)
+}
+AXES = ("y", "v", "dx", "centre")
+TAILLE_LOT = 1 << 18  # états évalués par appel au contrôleur pendant la compilation
+TABLE_PATH = "politique_table.npz"
+
+# =============================================================================
+# === Compilation ===
+# =============================================================================
+def _axes(grille):
+    mins = np.array([grille[a][0] for a in AXES])
+    pas = np.array([grille[a][2] for a in AXES])
+    n = np.array([int(round((grille[a][1] - grille[a][0]) / grille[a][2])) + 1 for a in AXES])
+    return mins, pas, n
+
+def compiler(controleur, grille=GRILLE_DEFAUT, vectorise=True, taille_lot=TAILLE_LOT):
+    """controleur(y, v, dx, centre) -> saut (bool) ; vectorise=False : fonction scalaire"""
+    if not vectorise:
+        controleur = np.vectorize(controleur, otypes=[bool])
+    mins, pas, n = _axes(grille)
+    table = np.empty(int(np.prod(n)), dtype=np.uint8)
+    for debut in range(0, table.size, taille_lot):
+        idx = np.arange(debut, min(debut + taille_lot, table.size))
+        coords = np.unravel_index(idx, n)
+        y, v, dx, centre = (mins[i] + coords[i] * pas[i] for i in range(4))
+        table[idx] = np.asarray(controleur(y, v, dx, centre), dtype=bool)
+    return PolitiqueTable(table.reshape(n), mins, pas)
+
+# =============================================================================
+# === Politique par table ===
+# =============================================================================
+class PolitiqueTable:
+    def __init__(self, table, mins, pas):
+        self.table = table
+        self.mins = np.asarray(mins, dtype=np.float64)
+        self.pas = np.asarray(pas, dtype=np.float64)
+        self.n = np.array(table.shape)
+        self._plat = table.reshape(-1)
+        self._strides = np.array([int(np.prod(self.n[i + 1:])) for i in range(4)])
+        # Version scalaire des constantes (évite les conversions numpy par frame)
+        self._s = [(float(self.mins[i]), float(self.pas[i]), int(self.n[i]) - 1, int(self._strides[i]))
+                   for i in range(4)]
+
+    def action(self, y, v, dx, centre):
+        """Décision pour un oiseau (True = saut)"""
+        i = 0
+        for val, (m, p, dernier, stride) in zip((y, v, dx, centre), self._s):
+            k = int(round((val - m) / p))
+            i += (0 if k < 0 else dernier if k > dernier else k) * stride
+        return bool(self._plat[i])
+
+    def actions(self, y, v, dx, centre):
+        """Décisions pour toute une population (tableaux de même taille)"""
+        i = np.zeros(np.shape(y), dtype=np.int64)
+        for a, val in enumerate((y, v, dx, centre)):
+            k = np.rint((np.asarray(val, dtype=np.float64) - self.mins[a]) / self.pas[a]).astype(np.int64)
+            np.clip(k, 0, self.n[a] - 1, out=k)
+            i += k * self._strides[a]
+        return self._plat[i].astype(bool)
+
+    def sauver(self, path=TABLE_PATH):
+        np.savez(path, table=self.table, mins=self.mins, pas=self.pas)
+
+    @classmethod
+    def charger(cls, path=TABLE_PATH):
+        with np.load(path) as data:
+            return cls(data["table"], data["mins"], data["pas"])
+
+def accord(controleur, politique, grille=GRILLE_DEFAUT, n=100000, seed=0):
+    """Part des états aléatoires (dans la grille) où la table décide comme le contrôleur"""
+    rng = np.random.default_rng(seed)
+    etats = [rng.uniform(grille[a][0], grille[a][1], n) for a in AXES]
+    return float(np.mean(politique.actions(*etats) == np.asarray(controleur(*etats), dtype=bool)))
+
+# =============================================================================
+# === Contrôleurs existants (versions vectorisées) ===
+# =============================================================================
+def controleur_seuil(seuil=18):
+    """bot_rule / bot_rule_simple (seuil 18), bot_action_rl de RL1 (20), Bot du GA (threshold)"""
+    return lambda y, v, dx, centre: y - centre > seuil
+
+def controleur_qtable(q):
+    """Q-table de FlipBird_QTable / RL1 (argmax dans l'état discrétisé)"""
+    from FlipBird_QTable import discretiser
+    q_etat = np.asarray(q).reshape(-1, 2)
+    def controleur(y, v, dx, centre):
+        etats = discretiser(np.column_stack([y, v, dx, centre - y]))
+        return q_etat[etats, 1] > q_etat[etats, 0]
+    return controleur
+
+def controleur_dqn(politique, largeur=400, hauteur=600):
+    """PolitiqueNumpy (dqn.pth de RL3) sur l'état normalisé de normalize_state"""
+    def controleur(y, v, dx, centre):
+        etats = np.column_stack([y / hauteur, np.tanh(v / 15.0), np.maximum(0.0, dx) / largeur,
+                                 (centre - y) / hauteur]).astype(np.float32)
+        return politique.actions(etats) == 1
+    return controleur
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile un contrôleur en table de décision")
+    parser.add_argument("controleur", choices=["seuil", "qtable", "dqn"])
+    parser.add_argument("--seuil", type=float, default=18)
+    parser.add_argument("--q", default="q_table.npy")
+    parser.add_argument("--modele", default="dqn.pth")
+    parser.add_argument("--sortie", default=TABLE_PATH)
+    args = parser.parse_args()
+
+    if args.controleur == "seuil":
+        controleur = controleur_seuil(args.seuil)
+    elif args.controleur == "qtable":
+        from FlipBird_QTable import charger_q
+        controleur = controleur_qtable(charger_q(args.q))
+    else:
+        from FlipBird_Policy import PolitiqueNumpy, npz_pour
+        # export à côté du modèle : autre.pth -> autre.npz (jamais le dqn.npz de --play)
+        controleur = controleur_dqn(PolitiqueNumpy(args.modele, npz_path=npz_pour(args.modele)))
+
+    t0 = time.perf_counter()
+    politique = compiler(controleur)
+    print(f"Table {politique.table.shape} ({politique.table.nbytes / 1e6:.1f} Mo) compilée en {time.perf_counter() - t0:.1f}s")
+    print(f"Accord avec le contrôleur : {accord(controleur, politique):.2%}")
+
+    etats = [np.random.default_rng(1).uniform(GRILLE_DEFAUT[a][0], GRILLE_DEFAUT[a][1], 50000) for a in AXES]
+    t0 = time.perf_counter()
+    politique.actions(*etats)
+    print(f"Population de 50000 oiseaux : {(time.perf_counter() - t0) * 1e3:.2f} ms")
+    politique.sauver(args.sortie)
+    print("Table sauvegardée :", args.sortie)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Q-learning tabulaire pour FlipBird_RL1_norm (sans pygame)
+- Même discrétisation que discretize_state de RL1 : 12 x 8 x 10 x 12 états, 2 actions
+- N parties headless jouées en parallèle (FlipBird_EnvRL, tuyaux de RL1 :
+  randint(100, HAUTEUR-200)) ; à chaque pas, une seule mise à jour vectorisée
+  de la table pour toutes les parties (les transitions tombant dans la même
+  case sont moyennées avec np.bincount)
+- La table est un .npy : sauvegardée via open_memmap, rechargée en memmap
+  (RL1 l'ouvre sans la copier en mémoire)
+
+Exemple : python FlipBird_QTable.py --pas 20000 --parties 256
+"""
+
+import argparse, os, time
+import numpy as np
+
+from FlipBird_Course import Course
+from FlipBird_EnvRL import VecFlappyEnv, HAUTEUR, LARGEUR
+
+FORME_Q = (12, 8, 10, 12, 2)  # y, vitesse, distance x, distance au centre du trou, action
+Q_PATH = "q_table.npy"
+
+# Apprentissage
+ALPHA = 0.1
+GAMMA = 0.99
+EPS_DEBUT = 0.1
+EPS_FIN = 0.0
+MAX_PAS_PARTIE = 20000  # une partie "parfaite" est coupée (sans fin d'épisode pour Q)
+
+# =============================================================================
+# === Discrétisation (identique à discretize_state de FlipBird_RL1_norm) ===
+# =============================================================================
+def discretiser(etats):
+    """etats bruts (N, 4) : o_y, o_v, pipe_dist_x, pipe_dist_y -> index d'état (N,)"""
+    o_y, o_v, dist_x, dist_y = etats[:, 0], etats[:, 1], etats[:, 2], etats[:, 3]
+    y_bin = np.clip(o_y / (HAUTEUR/12), 0, 11).astype(np.int64)
+    v_bin = np.clip((o_v+10)/20*8, 0, 7).astype(np.int64)
+    x_bin = np.clip(dist_x / LARGEUR * 10, 0, 9).astype(np.int64)
+    dy_bin = np.clip((dist_y + HAUTEUR/2)/(HAUTEUR)*12, 0, 11).astype(np.int64)
+    return np.ravel_multi_index((y_bin, v_bin, x_bin, dy_bin), FORME_Q[:-1])
+
+# =============================================================================
+# === Sauvegarde / chargement (.npy memmap) ===
+# =============================================================================
+def sauver_q(q, path=Q_PATH):
+    """Écrit la table dans un .npy (fichier temporaire puis renommage)"""
+    tmp = path + ".tmp.npy"
+    m = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float64, shape=FORME_Q)
+    m[...] = q
+    m.flush()
+    del m
+    os.replace(tmp, path)
+
+def charger_q(path=Q_PATH, mode="r"):
+    """Table en memmap (mode "r" : lecture seule, "r+" : modifiable sur disque)"""
+    q = np.load(path, mmap_mode=mode)
+    if q.shape != FORME_Q:
+        raise ValueError(f"{path} : forme {q.shape}, {FORME_Q} attendue")
+    return q
+
+# =============================================================================
+# === Entraînement ===
+# =============================================================================
+def entrainer_q(pas=20000, n_parties=256, alpha=ALPHA, gamma=GAMMA, eps_debut=EPS_DEBUT, eps_fin=EPS_FIN,
+                seed=None, q=None, verbose=True):
+    """Q-learning sur n_parties en parallèle ; renvoie (table, scores des parties finies)"""
+    if q is None:
+        q = np.zeros(FORME_Q)
+    q_flat = q.reshape(-1)
+    q_etat = q.reshape(-1, 2)
+    taille = q_flat.size
+    rng = np.random.default_rng(seed)
+    env = VecFlappyEnv(n_parties, course=Course(seed, 100, HAUTEUR - 200), seed=seed,
+                       max_episode_steps=MAX_PAS_PARTIE, raw=True)
+    etats = discretiser(env.obs)
+    scores = []
+    t0 = time.perf_counter()
+    bloc = max(1, pas // 10)
+
+    for i in range(pas):
+        eps = eps_debut + (eps_fin - eps_debut) * i / max(1, pas - 1)
+        actions = q_etat[etats].argmax(1)
+        hasard = rng.random(n_parties) < eps
+        actions[hasard] = rng.integers(0, 2, size=int(hasard.sum()))
+
+        suivants_bruts, recompenses, morts = env.step(actions)
+        suivants = discretiser(suivants_bruts)
+
+        # Cible de Q-learning pour toutes les parties, puis moyenne par case (état, action)
+        cases = etats * 2 + actions
+        cible = recompenses + gamma * q_etat[suivants].max(1) * ~morts
+        delta = cible - q_flat[cases]
+        somme = np.bincount(cases, weights=delta, minlength=taille)
+        nombre = np.bincount(cases, minlength=taille)
+        touchees = np.flatnonzero(nombre)
+        q_flat[touchees] += alpha * somme[touchees] / nombre[touchees]
+
+        etats = discretiser(env.obs)
+
+        if verbose and (i + 1) % bloc == 0:
+            fini = env.finished_scores
+            moy = sum(fini) / len(fini) if fini else 0.0
+            print(f"pas {i + 1}/{pas} | eps {eps:.3f} | parties finies {len(fini)} "
+                  f"moy {moy:.2f} best {max(fini, default=0)} | {(i + 1) * n_parties / (time.perf_counter() - t0):.0f} transitions/s")
+            scores.extend(fini)
+            fini.clear()
+    scores.extend(env.finished_scores)
+    return q, scores
+
+def main():
+    parser = argparse.ArgumentParser(description="Q-learning tabulaire (FlipBird_RL1_norm)")
+    parser.add_argument("--pas", type=int, default=20000, help="pas vectorisés (x parties transitions)")
+    parser.add_argument("--parties", type=int, default=256)
+    parser.add_argument("--alpha", type=float, default=ALPHA)
+    parser.add_argument("--gamma", type=float, default=GAMMA)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--sortie", default=Q_PATH)
+    parser.add_argument("--reprendre", action="store_true", help="repart de la table existante")
+    args = parser.parse_args()
+
+    q = None
+    if args.reprendre and os.path.exists(args.sortie):
+        q = np.array(charger_q(args.sortie))
+    q, _ = entrainer_q(args.pas, args.parties, args.alpha, args.gamma, seed=args.seed, q=q)
+    sauver_q(q, args.sortie)
+    print("Table sauvegardée :", args.sortie)
+
+if __name__ == "__main__":
+    main()
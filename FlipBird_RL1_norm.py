@@ -1,5 +1,6 @@
-import pygame, random, sys, math
+import pygame, random, sys, math, os
 import numpy as np
+from FlipBird_QTable import charger_q, Q_PATH
 
 # ---------- Initialisation ----------
 pygame.init()
@@ -76,15 +77,20 @@ def discretize_state(o_y, o_v, pipe_dist_x, pipe_dist_y):
     dy_bin = int(min(max((pipe_dist_y + HAUTEUR/2)/(HAUTEUR)*12,0),11))
     return (y_bin, v_bin, x_bin, dy_bin)
 
-# Q-Table heuristique / pré-entrainée (randomized pour l’exemple)
-Q_table = np.random.rand(12,8,10,12,2)  # états discret, 2 actions (0=no jump,1=jump)
+# Q-Table entraînée par FlipBird_QTable.py (q_table.npy, ouverte en memmap)
+# sinon table aléatoire et règle heuristique comme avant
+Q_ENTRAINEE = os.path.exists(Q_PATH)
+if Q_ENTRAINEE:
+    Q_table = charger_q(Q_PATH)
+else:
+    Q_table = np.random.rand(12,8,10,12,2)  # états discret, 2 actions (0=no jump,1=jump)
 
 def bot_action_rl():
     """
-    Mode Auto RL simulé : 
+    Mode Auto RL :
     - regarde le prochain tuyau
-    - calcule la différence verticale entre l'oiseau et le centre du trou
-    - saute si l'oiseau est trop bas
+    - avec une Q-table entraînée : action de plus grande valeur dans l'état discrétisé
+    - sinon : saute si l'oiseau est trop bas par rapport au centre du trou
     """
     if not tuyaux:
         return False
@@ -93,6 +99,11 @@ def bot_action_rl():
         prochain = tuyaux[1]
 
     centre_trou = (prochain["haut"] + prochain["bas"]) / 2
+    if Q_ENTRAINEE:
+        etat = discretize_state(oiseau_y, vitesse, prochain["x"] - oiseau_x, centre_trou - oiseau_y)
+        q = Q_table[etat]
+        return q[1] > q[0]
+
     diff = oiseau_y - centre_trou
 
     tolerance = 20  # ajustable
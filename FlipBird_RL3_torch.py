@@ -3,23 +3,22 @@ Flappy Bird + DQN (PyTorch) integrated in Pygame
 - Menu: Manual / Auto RL (train & play)
 - Agent trains online, can save/load model to dqn.pth
 - Fast mode to accelerate training (less rendering)
+- python FlipBird_RL3_torch.py --play : inference only (NumPy policy from dqn.pth, no torch)
 """
 
-import pygame, random, sys, math, time, os
-from collections import deque
+import pygame, sys, math, time, os
 import numpy as np
-
-# Attempt to import torch (PyTorch)
-
-try:
-    import torch
-    import torch.nn as nn
-    import torch.optim as optim
-    TORCH_AVAILABLE = True
-except Exception as e:
-    TORCH_AVAILABLE = False
-    print("Torch not available. Install torch to run RL: pip install torch")
-    # We will still provide a fallback rule-based bot if torch missing.
+from FlipBird_Course import Course
+from FlipBird_EnvRL import (VecFlappyEnv, STATE_DIM, ACTION_DIM,
+                            REW_PER_FRAME, REW_PASS_PIPE, REW_DEATH)
+from FlipBird_Policy import PolitiqueNumpy, MODEL_PATH
+
+# Inference only: the training stack (torch, optimizer, target net, replay) is never imported
+PLAY_ONLY = "--play" in sys.argv
+if PLAY_ONLY:
+    TORCH_AVAILABLE, Agent = False, None
+else:
+    from FlipBird_DQN import TORCH_AVAILABLE, Agent, train_vectorized
 
 # ----------------- Config -----------------
 LARGEUR, HAUTEUR = 400, 600
@@ -31,28 +30,15 @@ LARGEUR_TUYAU = 60
 ECART = 150
 JUMP_V = -8.0
 
-MODEL_PATH = "dqn.pth"
+SEED_COURSE = None  # parcours de tuyaux seedé (None = seed aléatoire au lancement)
 FAST_TRAIN = False  # toggle to speed up training (-- set True to train faster with reduced render)
 STEPS_PER_RENDER = 1  # when FAST_TRAIN True, run several env steps per Pygame frame
 
-# DQN hyperparams
-STATE_DIM = 4  # [norm_o_y, norm_o_v, norm_pipe_dx, norm_pipe_dy]
-ACTION_DIM = 2  # 0 = nothing, 1 = jump
-HIDDEN = 128
-GAMMA = 0.99
-LR = 1e-3
-BATCH_SIZE = 64
-BUFFER_SIZE = 50000
-MIN_REPLAY = 500
-EPS_START = 1.0
-EPS_END = 0.02
-EPS_DECAY = 0.9995  # multiplicative decay per step
-TARGET_UPDATE_FREQ = 1000  # steps
-
-# Rewards
-REW_PER_FRAME = 0.1
-REW_PASS_PIPE = 50.0
-REW_DEATH = -200.0
+# Vectorized training (V key): K headless games stepped together, one batched forward per step
+NUM_ENVS = 32
+VEC_STEPS = 500  # vectorized steps per burst (NUM_ENVS transitions each)
+
+# Rewards: REW_* come from FlipBird_EnvRL (one definition for FlappyEnv and VecFlappyEnv)
 
 # ----------------- Pygame init -----------------
 pygame.init()
@@ -62,9 +48,12 @@ clock = pygame.time.Clock()
 font = pygame.font.SysFont("Arial", 20, bold=True)
 
 # ----------------- Utility / Env functions -----------------
-def creer_tuyau():
-    hauteur = random.randint(80, HAUTEUR - 220)
-    return {"x": LARGEUR, "haut": hauteur, "bas": hauteur + ECART}
+# Same pipe course for every episode: policies are compared on identical workloads
+course = Course(SEED_COURSE, 80, HAUTEUR - 220)
+
+def creer_tuyau(lecteur):
+    hauteur = lecteur.suivant()
+    return {"x": LARGEUR, "haut": hauteur, "bas": hauteur + ECART, "passed": False}
 
 def afficher_tuyaux(surface, tuyaux):
     for t in tuyaux:
@@ -106,84 +95,71 @@ def normalize_state(o_y, o_v, pipe, o_x=60):
         norm_dy = dy
     return np.array([norm_y, norm_v, norm_dx, norm_dy], dtype=np.float32)
 
+class FlappyEnv:
+    """One game: step(action) -> (state, reward, next_state, done).
+    The next pipe and the normalized state are computed once per step and cached."""
+    def __init__(self, course, o_x=60):
+        self.course = course
+        self.o_x = o_x
+        self.reset()
+
+    def reset(self):
+        self.o_y = HAUTEUR / 2.0
+        self.o_v = 0.0
+        self.lecteur = self.course.lecteur()
+        self.tuyaux = [creer_tuyau(self.lecteur), creer_tuyau(self.lecteur)]
+        self.tuyaux[1]["x"] = self.tuyaux[0]["x"] + 220
+        self.score = 0
+        self.done = False
+        self._observe()
+        return self.state
+
+    def _observe(self):
+        self.pipe = get_next_pipe(self.tuyaux, self.o_x)
+        self.state = normalize_state(self.o_y, self.o_v, self.pipe, self.o_x)
+
+    def step(self, action):
+        s = self.state
+        tuyaux = self.tuyaux
+
+        # Apply action + physics
+        if action == 1:
+            self.o_v = JUMP_V
+        self.o_v += GRAVITE
+        self.o_y += self.o_v
+
+        # Move pipes
+        for t in tuyaux:
+            t["x"] -= VITESSE_TUYAUX
+
+        # Add pipes
+        if tuyaux[-1]["x"] < LARGEUR - 200:
+            new = creer_tuyau(self.lecteur)
+            new["x"] = tuyaux[-1]["x"] + 220
+            tuyaux.append(new)
+
+        # Score + pipe-pass reward, once per pipe
+        reward = REW_PER_FRAME
+        front = tuyaux[0]
+        if not front["passed"] and front["x"] + LARGEUR_TUYAU < self.o_x:
+            front["passed"] = True
+            self.score += 1
+            reward += REW_PASS_PIPE
+
+        # Remove old pipes
+        if front["x"] + LARGEUR_TUYAU < 0:
+            tuyaux.pop(0)
+
+        # Collision ends the episode
+        self.done = verifier_collision(self.o_y, tuyaux)
+        if self.done:
+            reward = REW_DEATH
+
+        self._observe()
+        return s, reward, self.state, self.done
+
 # ----------------- DQN Model & Agent -----------------
-if TORCH_AVAILABLE:
-    class DQN(nn.Module):
-        def __init__(self, input_dim, hidden_dim, output_dim):
-            super().__init__()
-            self.net = nn.Sequential(
-                nn.Linear(input_dim, hidden_dim),
-                nn.ReLU(),
-                nn.Linear(hidden_dim, hidden_dim),
-                nn.ReLU(),
-                nn.Linear(hidden_dim, output_dim)
-            )
-        def forward(self, x):
-            return self.net(x)
-
-    class Agent:
-        def __init__(self, state_dim, action_dim):
-            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-            self.policy = DQN(state_dim, HIDDEN, action_dim).to(self.device)
-            self.target = DQN(state_dim, HIDDEN, action_dim).to(self.device)
-            self.target.load_state_dict(self.policy.state_dict())
-            self.optimizer = optim.Adam(self.policy.parameters(), lr=LR)
-            self.replay = deque(maxlen=BUFFER_SIZE)
-            self.steps = 0
-            self.eps = EPS_START
-
-        def select_action(self, state, training=True):
-            # state: numpy array
-            if training and random.random() < self.eps:
-                return random.randint(0, ACTION_DIM-1)
-            s = torch.FloatTensor(state).unsqueeze(0).to(self.device)
-            with torch.no_grad():
-                q = self.policy(s)
-            return int(torch.argmax(q).item())
-
-        def remember(self, s, a, r, s2, done):
-            self.replay.append((s, a, r, s2, done))
-
-        def replay_train(self):
-            if len(self.replay) < MIN_REPLAY:
-                return 0.0
-            batch = random.sample(self.replay, BATCH_SIZE)
-            s = torch.FloatTensor([b[0] for b in batch]).to(self.device)
-            a = torch.LongTensor([b[1] for b in batch]).unsqueeze(1).to(self.device)
-            r = torch.FloatTensor([b[2] for b in batch]).to(self.device)
-            s2 = torch.FloatTensor([b[3] for b in batch]).to(self.device)
-            done = torch.FloatTensor([float(b[4]) for b in batch]).to(self.device)
-
-            q_vals = self.policy(s).gather(1, a).squeeze(1)
-            with torch.no_grad():
-                q_next = self.target(s2).max(1)[0]
-            q_target = r + (1.0 - done) * GAMMA * q_next
-
-            loss = nn.MSELoss()(q_vals, q_target)
-            self.optimizer.zero_grad()
-            loss.backward()
-            self.optimizer.step()
-
-            # epsilon decay
-            if self.eps > EPS_END:
-                self.eps *= EPS_DECAY
-            self.steps += 1
-            if self.steps % TARGET_UPDATE_FREQ == 0:
-                self.target.load_state_dict(self.policy.state_dict())
-            return loss.item()
-
-        def save(self, path=MODEL_PATH):
-            torch.save(self.policy.state_dict(), path)
-
-        def load(self, path=MODEL_PATH):
-            if os.path.exists(path):
-                self.policy.load_state_dict(torch.load(path, map_location=self.device))
-                self.target.load_state_dict(self.policy.state_dict())
-                print("Loaded model from", path)
-                return True
-            return False
-else:
-    Agent = None
+# DQN, Agent and train_vectorized live in FlipBird_DQN (no pygame, shared with FlipBird_RL_Train)
 
 # ----------------- Rule-based fallback (if no torch) -----------------
 def bot_rule_simple(o_y, tuyaux):
@@ -202,13 +178,9 @@ def main():
     running = True
     en_jeu = False
 
-    # player variables
+    # player / pipes: one game environment
     o_x = 60
-    o_y = HAUTEUR / 2.0
-    o_v = 0.0
-    tuyaux = [creer_tuyau(), creer_tuyau()]
-    tuyaux[1]["x"] = tuyaux[0]["x"] + 220
-    score = 0
+    env = FlappyEnv(course, o_x)
     best_manual = 0
     best_rl = 0
 
@@ -216,6 +188,14 @@ def main():
     agent = Agent(STATE_DIM, ACTION_DIM) if TORCH_AVAILABLE else None
     if agent and os.path.exists(MODEL_PATH):
         agent.load(MODEL_PATH)
+    politique = None
+    if PLAY_ONLY and os.path.exists(MODEL_PATH):
+        try:
+            politique = PolitiqueNumpy(MODEL_PATH)
+        except (ImportError, OSError) as e:
+            # no torch to export dqn.npz (or unreadable file): rule-based bot instead
+            print("Policy not available, using the rule-based bot:", e)
+    vec_env = None
 
     # UI button rects
     MENU_BTNS = {
@@ -233,17 +213,11 @@ def main():
     losses = []
     episode_count = 0
     total_steps = 0
-    last_pipe_pass_x = None
 
     def reset_game():
-        nonlocal o_y, o_v, tuyaux, score, en_jeu, last_pipe_pass_x
-        o_y = HAUTEUR / 2.0
-        o_v = 0.0
-        tuyaux = [creer_tuyau(), creer_tuyau()]
-        tuyaux[1]["x"] = tuyaux[0]["x"] + 220
-        score = 0
+        nonlocal en_jeu
+        env.reset()
         en_jeu = True
-        last_pipe_pass_x = None
 
     while running:
         # render loop / possibly multiple env steps per frame for FAST_TRAIN
@@ -261,6 +235,19 @@ def main():
                     if event.key == pygame.K_s and agent:
                         agent.save()
                         print("Model saved to", MODEL_PATH)
+                    if event.key == pygame.K_v and agent:
+                        # Burst of headless vectorized training on the same course
+                        if vec_env is None:
+                            vec_env = VecFlappyEnv(NUM_ENVS, course=course)
+                        t0 = time.perf_counter()
+                        vec_losses, vec_scores = train_vectorized(agent, vec_env, VEC_STEPS)
+                        dt = time.perf_counter() - t0
+                        losses.extend(vec_losses)
+                        total_steps += VEC_STEPS * NUM_ENVS
+                        if vec_scores:
+                            best_rl = max(best_rl, max(vec_scores))
+                        print(f"Vectorized: {VEC_STEPS * NUM_ENVS} transitions in {dt:.1f}s "
+                              f"({VEC_STEPS * NUM_ENVS / dt:.0f}/s), {len(vec_scores)} episodes, eps {agent.eps:.3f}")
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     pos = event.pos
                     if mode is None:
@@ -290,79 +277,38 @@ def main():
                 if keys[pygame.K_SPACE]:
                     action = 1
             else:
-                # RL / agent decision
+                # RL / agent decision (state cached by the env)
                 if agent is not None:
-                    pipe = get_next_pipe(tuyaux, o_x)
-                    s = normalize_state(o_y, o_v, pipe, o_x)
-                    action = agent.select_action(s, training=True)
+                    action = agent.select_action(env.state, training=True)
+                elif politique is not None:
+                    action = politique.action(env.state)
                 else:
                     # fallback
-                    action = 1 if bot_rule_simple(o_y, tuyaux) else 0
-
-            # Apply action
-            if action == 1:
-                o_v = JUMP_V
-
-            # Physics update
-            o_v += GRAVITE
-            o_y += o_v
-
-            # Move pipes
-            for t in tuyaux:
-                t["x"] -= VITESSE_TUYAUX
-
-            # Add pipes
-            if tuyaux[-1]["x"] < LARGEUR - 200:
-                new = creer_tuyau()
-                new["x"] = tuyaux[-1]["x"] + 220
-                tuyaux.append(new)
-
-            # Score increment (when a pipe is passed)
-            if tuyaux and tuyaux[0]["x"] + LARGEUR_TUYAU < o_x and (last_pipe_pass_x != tuyaux[0]["x"]):
-                score += 1
-                last_pipe_pass_x = tuyaux[0]["x"]
-                # reward shaping handled when storing transition
-
-            # Remove old pipes
-            if tuyaux and tuyaux[0]["x"] + LARGEUR_TUYAU < 0:
-                tuyaux.pop(0)
-
-            # Collision check
-            done = verifier_collision(o_y, tuyaux)
-            reward = REW_PER_FRAME
-            # reward for passing pipe
-            # we set reward when the pipe is popped (above) but easier: if score increased we add reward
-            # for simplicity add small bonus when score increments
-            # (handled below by comparing previous score if needed)
-            if done:
-                reward = REW_DEATH
+                    action = 1 if bot_rule_simple(env.o_y, env.tuyaux) else 0
+
+            s, reward, s2, done = env.step(action)
 
             # RL memory & training
             if agent is not None and mode == "rl":
-                # compute state and next_state
-                pipe = get_next_pipe(tuyaux, o_x)
-                s = normalize_state(o_y - o_v - GRAVITE, o_v - GRAVITE, pipe, o_x)  # approximate previous - optional
-                # Actually better to save pre-action state; to simplify we compute state before action
-                # Recompute properly: compute state before action by simulating backward would complicate; instead:
-                # We'll instead compute state now as "current state after step" and use action selected earlier. It's a bit noisy but works for demo.
-
-                s_pre = normalize_state(max(0.0, min(HAUTEUR, o_y - o_v)), o_v - GRAVITE, pipe, o_x)  # approximate
-                pipe_next = get_next_pipe(tuyaux, o_x)
-                s_post = normalize_state(o_y, o_v, pipe_next, o_x)
-
-                # reward: add pipe pass bonus if last_pipe_pass_x changed
-                # For simplicity, if recent pipe was passed, add bonus
-                # (score already incremented above)
-                # detect if just passed a pipe by checking if any pipe x moved past o_x between steps:
-                # We'll approximate: if last_pipe_pass_x changed earlier this step, we already incremented score; add bonus
-                # (for simplicity not tracking prev score here, use small heuristic)
-                # store transition
-                agent.remember(s_post, action, reward, s_post if done else s_post, done)
+                agent.remember(s, action, reward, s2, done)
                 loss = agent.replay_train()
                 if loss:
                     losses.append(loss)
                 total_steps += 1
 
+            if done:
+                episode_count += 1
+                if mode == "manu":
+                    best_manual = max(best_manual, env.score)
+                    en_jeu = False
+                else:
+                    best_rl = max(best_rl, env.score)
+                    if agent is not None:
+                        # training: start the next episode right away
+                        env.reset()
+                    else:
+                        en_jeu = False
+
             # End of one env step
 
         # ---- Rendering (once per frame) ----
@@ -381,11 +327,12 @@ def main():
             continue
 
         # draw pipes and bird
-        afficher_tuyaux(Ecran, tuyaux)
+        afficher_tuyaux(Ecran, env.tuyaux)
+        o_y, o_v = env.o_y, env.o_v
 
         # RL visualization: centre of next pipe
         if mode == "rl":
-            p = get_next_pipe(tuyaux, o_x)
+            p = env.pipe
             if p:
                 centre = (p["haut"] + p["bas"]) / 2.0
                 pygame.draw.line(Ecran, (200,0,0), (p["x"], centre), (p["x"] + LARGEUR_TUYAU, centre), 2)
@@ -404,7 +351,7 @@ def main():
 
         # HUD
         Ecran.blit(font.render(f"Mode: {'MANUEL' if mode=='manu' else 'RL'}", True, (0,0,0)), (10,10))
-        Ecran.blit(font.render(f"Score: {score}", True, (255,255,255)), (10,40))
+        Ecran.blit(font.render(f"Score: {env.score}", True, (255,255,255)), (10,40))
         Ecran.blit(font.render(f"Best Manu: {best_manual if 'best_manual' in locals() else 0}", True, (0,0,0)), (LARGEUR-180,10))
         # show best RL
         Ecran.blit(font.render(f"Best RL: {best_rl}", True, (0,0,0)), (LARGEUR-180,40))
@@ -418,7 +365,7 @@ def main():
             pygame.draw.rect(Ecran, (0,0,0,128), (20, 140, LARGEUR-40, 180))
             title = font.render("GAME OVER", True, (200,0,0))
             Ecran.blit(title, (LARGEUR//2 - title.get_width()//2, 160))
-            sc = font.render(f"Score: {score}", True, (0,0,0))
+            sc = font.render(f"Score: {env.score}", True, (0,0,0))
             Ecran.blit(sc, (LARGEUR//2 - sc.get_width()//2, 200))
             # show best
             if mode == "manu":
@@ -438,15 +385,8 @@ def main():
         pygame.display.flip()
         clock.tick(FPS if not FAST_TRAIN else 1200)
 
-        # Check end-of-game to update best scores & record episode
+        # Game over: best scores / episode already recorded at the collision
         if not en_jeu:
-            episode_count += 1
-            if mode == "manu":
-                if score > best_manual:
-                    best_manual = score
-            elif mode == "rl":
-                if score > best_rl:
-                    best_rl = score
             # small wait to allow button clicks
             time.sleep(0.05)
 
@@ -0,0 +1,102 @@
+"""
+Headless DQN trainer (no display, no pygame)
+- Trains the FlipBird_RL3_torch agent on K vectorized games (FlipBird_EnvRL)
+- Every --every steps a full checkpoint is written atomically: policy, target,
+  optimizer, eps, steps, replay buffer, env and RNG states
+- --resume continues exactly from the checkpoint (after a crash / preemption);
+  SIGTERM / Ctrl+C stop at once: only the interrupted chunk is lost
+- At the end the policy weights go to dqn.pth, loadable by the game
+
+Example: python FlipBird_RL_Train.py --steps 20000 --envs 32 --resume
+"""
+
+import argparse, os, random, signal, sys, time
+
+from FlipBird_Course import Course
+from FlipBird_EnvRL import VecFlappyEnv, HAUTEUR
+from FlipBird_DQN import TORCH_AVAILABLE, Agent, MODEL_PATH, CPU_THREADS, save_atomic, train_vectorized
+
+if TORCH_AVAILABLE:
+    import torch
+
+CHECKPOINT_PATH = "dqn_checkpoint.pt"
+CHECKPOINT_EVERY = 1000  # vectorized steps between checkpoints
+
+class _Arret(Exception):
+    pass
+
+def _signal_arret(signum, frame):
+    raise _Arret()
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless DQN training with checkpoints")
+    parser.add_argument("--steps", type=int, default=20000, help="total vectorized steps (x envs transitions)")
+    parser.add_argument("--envs", type=int, default=32, help="games stepped together")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--course", type=int, default=None, help="pipe course seed (default: --seed)")
+    parser.add_argument("--max-episode-steps", type=int, default=None)
+    parser.add_argument("--prioritized", action="store_true", help="sum-tree prioritized replay")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH)
+    parser.add_argument("--every", type=int, default=CHECKPOINT_EVERY, help="checkpoint period (vectorized steps)")
+    parser.add_argument("--resume", action="store_true", help="continue from --checkpoint if it exists")
+    parser.add_argument("--model", default=MODEL_PATH, help="policy weights written at the end")
+    parser.add_argument("--threads", type=int, default=CPU_THREADS, help="torch intra-op threads on CPU (0 = torch default)")
+    parser.add_argument("--bf16", action="store_true", help="bfloat16 autocast for forward/backward")
+    args = parser.parse_args()
+
+    if not TORCH_AVAILABLE:
+        sys.exit("Torch not available. Install torch to run RL: pip install torch")
+
+    if args.seed is not None:
+        random.seed(args.seed)
+        torch.manual_seed(args.seed)
+    agent = Agent(prioritized=args.prioritized, seed=args.seed, cpu_threads=args.threads, bf16=args.bf16)
+    done_steps = 0
+    course_seed = args.course if args.course is not None else args.seed
+    env_state = None
+    if args.resume and os.path.exists(args.checkpoint):
+        extra = agent.load_checkpoint(args.checkpoint)
+        done_steps = extra["vec_steps"]
+        env_state = extra["env"]
+        course_seed = env_state["course_seed"]
+        print(f"Resumed {args.checkpoint}: {done_steps} vectorized steps, "
+              f"{agent.steps} updates, eps {agent.eps:.3f}, replay {len(agent.replay)}")
+
+    n_envs = env_state["n"] if env_state else args.envs
+    env = VecFlappyEnv(n_envs, course=Course(course_seed, 80, HAUTEUR - 220), seed=args.seed,
+                       max_episode_steps=args.max_episode_steps)
+    if env_state:
+        env.load_state_dict(env_state)
+
+    def checkpoint():
+        agent.save_checkpoint(args.checkpoint, {"vec_steps": done_steps, "env": env.state_dict()})
+
+    signal.signal(signal.SIGTERM, _signal_arret)
+    t0 = time.perf_counter()
+    start_steps = done_steps
+    best = 0
+    try:
+        while done_steps < args.steps:
+            chunk = min(args.every, args.steps - done_steps)
+            losses, scores = train_vectorized(agent, env, chunk)
+            done_steps += chunk
+            checkpoint()
+            if scores:
+                best = max(best, max(scores))
+            dt = time.perf_counter() - t0
+            rate = (done_steps - start_steps) * n_envs / dt
+            loss = sum(losses) / len(losses) if losses else 0.0
+            avg = sum(scores) / len(scores) if scores else 0.0
+            print(f"step {done_steps}/{args.steps} | updates {agent.steps} | eps {agent.eps:.3f} | "
+                  f"loss {loss:.3f} | episodes {len(scores)} avg {avg:.2f} best {best} | "
+                  f"{rate:.0f} transitions/s, {agent.updates_per_sec():.0f} updates/s")
+    except (_Arret, KeyboardInterrupt):
+        # The interrupted chunk is lost; the last checkpoint stays consistent
+        print(f"Interrupted, resume with --resume from {args.checkpoint} ({done_steps} steps)")
+        sys.exit(1)
+
+    save_atomic(agent.policy.state_dict(), args.model)
+    print("Policy saved to", args.model)
+
+if __name__ == "__main__":
+    main()
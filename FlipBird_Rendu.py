@@ -0,0 +1,111 @@
+"""
+Rendu par rectangles modifiés (dirty rects) pour les écrans de jeu
+- Au début de chaque frame, seul le fond sous les objets de la frame précédente
+  est restauré (au lieu de re-blitter tout le fond)
+- À la fin, pygame.display.update ne reçoit que les zones anciennes + nouvelles
+- invalider() force un rendu complet (retour d'un menu, changement de fond)
+- RenduPopulation : tous les oiseaux en un seul Surface.blits, un seul par
+  position de pixel, plafonné à MAX_OISEAUX avec une barre de densité
+"""
+
+import pygame
+
+MAX_OISEAUX = 1000   # oiseaux dessinés au maximum par frame
+HAUTEUR_BANDE = 10   # hauteur (px) des cases de la barre de densité
+
+# =============================================================================
+# === Rendu dirty rects ===
+# =============================================================================
+class RenduDirty:
+    def __init__(self, ecran, fond):
+        """fond : Surface de la taille de l'écran, ou couleur (r, g, b)"""
+        self.ecran = ecran
+        self.zone = ecran.get_rect()
+        if isinstance(fond, pygame.Surface):
+            self.fond = fond
+        else:
+            self.fond = pygame.Surface(self.zone.size).convert()
+            self.fond.fill(fond)
+        self.anciens = []   # zones dessinées à la frame précédente
+        self.nouveaux = []  # zones dessinées à cette frame
+        self.complet = True
+
+    def invalider(self):
+        self.complet = True
+
+    def debut_frame(self):
+        """Remet le fond sous les objets de la frame précédente"""
+        if self.complet:
+            self.ecran.blit(self.fond, (0, 0))
+        else:
+            for r in self.anciens:
+                self.ecran.blit(self.fond, r, r)
+
+    def ajouter(self, rect):
+        """Déclare une zone dessinée (rect renvoyé par blit / draw.*)"""
+        if rect is not None:
+            r = pygame.Rect(rect).clip(self.zone)
+            if r.width and r.height:
+                self.nouveaux.append(r)
+        return rect
+
+    def fin_frame(self):
+        if self.complet:
+            pygame.display.flip()
+            self.complet = False
+        else:
+            pygame.display.update(self.anciens + self.nouveaux)
+        self.anciens, self.nouveaux = self.nouveaux, []
+
+# =============================================================================
+# === Rendu groupé d'une population d'oiseaux ===
+# =============================================================================
+class RenduPopulation:
+    def __init__(self, image=None, rayon=12, couleur=(255,220,0), max_oiseaux=MAX_OISEAUX):
+        """image : sprite de l'oiseau ; sinon un disque (rayon, couleur) pré-rendu"""
+        if image is None:
+            image = pygame.Surface((2 * rayon + 1, 2 * rayon + 1), pygame.SRCALPHA)
+            pygame.draw.circle(image, couleur, (rayon, rayon), rayon)
+            self.dx, self.dy = rayon, rayon
+        else:
+            self.dx, self.dy = image.get_width() // 2, image.get_height() // 2
+        self.image = image
+        self.max_oiseaux = max_oiseaux
+        self.dessines = 0
+        self.total = 0
+
+    def dessiner(self, ecran, positions):
+        """positions : (x, y) des oiseaux vivants. Renvoie la zone touchée (Rect) ou None"""
+        self.total = len(positions)
+        # Une seule copie par pixel : des oiseaux superposés ne changent pas l'image
+        uniques = list(dict.fromkeys((int(x), int(y)) for x, y in positions))
+        if len(uniques) > self.max_oiseaux:
+            pas = len(uniques) / self.max_oiseaux
+            uniques = [uniques[int(i * pas)] for i in range(self.max_oiseaux)]
+        self.dessines = len(uniques)
+        if not uniques:
+            return None
+
+        image, dx, dy = self.image, self.dx, self.dy
+        ecran.blits([(image, (x - dx, y - dy)) for x, y in uniques], doreturn=False)
+
+        xs = [p[0] for p in uniques]
+        ys = [p[1] for p in uniques]
+        zone = pygame.Rect(min(xs) - dx, min(ys) - dy,
+                           max(xs) - min(xs) + image.get_width(), max(ys) - min(ys) + image.get_height())
+        if self.dessines < self.total:
+            zone.union_ip(self._densite(ecran, positions, zone.left - 8))
+        return zone
+
+    def _densite(self, ecran, positions, x):
+        """Barre verticale : plus la case est sombre, plus il y a d'oiseaux à cette hauteur"""
+        comptes = {}
+        for _, y in positions:
+            b = int(y) // HAUTEUR_BANDE
+            comptes[b] = comptes.get(b, 0) + 1
+        maxi = max(comptes.values())
+        haut, bas = min(comptes), max(comptes)
+        for b, n in comptes.items():
+            c = 255 - int(200 * n / maxi)
+            ecran.fill((255, c, c), (x, b * HAUTEUR_BANDE, 5, HAUTEUR_BANDE))
+        return pygame.Rect(x, haut * HAUTEUR_BANDE, 5, (bas - haut + 1) * HAUTEUR_BANDE)
@@ -0,0 +1,181 @@
+"""
+Replay memory for the DQN agent (FlipBird_RL3_torch)
+- Transitions stored in preallocated contiguous NumPy arrays (ring buffer)
+- Batch sampling = one vectorized index draw + np.take into reused batch arrays,
+  handed to torch with torch.from_numpy (no copy, no Python list building)
+- PrioritizedReplayBuffer: proportional prioritized replay on a sum-tree,
+  O(log n) sampling and priority updates, vectorized over the whole batch
+"""
+
+import numpy as np
+
+class ReplayBuffer:
+    def __init__(self, capacity, state_dim, batch_size=64, seed=None):
+        self.capacity = capacity
+        self.states = np.zeros((capacity, state_dim), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_dim), dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=np.float32)
+        self.pos = 0
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+        self._alloc_batch(batch_size)
+
+    def _alloc_batch(self, batch_size):
+        # Batch arrays are reused between calls: consume them before sampling again
+        dim = self.states.shape[1]
+        self.batch_size = batch_size
+        self._b_s = np.empty((batch_size, dim), dtype=np.float32)
+        self._b_a = np.empty(batch_size, dtype=np.int64)
+        self._b_r = np.empty(batch_size, dtype=np.float32)
+        self._b_s2 = np.empty((batch_size, dim), dtype=np.float32)
+        self._b_d = np.empty(batch_size, dtype=np.float32)
+
+    def __len__(self):
+        return self.size
+
+    def push(self, s, a, r, s2, done):
+        i = self.pos
+        self.states[i] = s
+        self.actions[i] = a
+        self.rewards[i] = r
+        self.next_states[i] = s2
+        self.dones[i] = done
+        self.pos = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def push_batch(self, s, a, r, s2, done):
+        """Store K transitions at once (vectorized environments)"""
+        n = len(a)
+        idx = (self.pos + np.arange(n)) % self.capacity
+        self.states[idx] = s
+        self.actions[idx] = a
+        self.rewards[idx] = r
+        self.next_states[idx] = s2
+        self.dones[idx] = done
+        self.pos = int((self.pos + n) % self.capacity)
+        self.size = min(self.size + n, self.capacity)
+
+    def sample_indices(self, batch_size):
+        return self.rng.integers(0, self.size, size=batch_size)
+
+    def gather(self, idx):
+        """(s, a, r, s2, done) arrays for the given indices, in the reused batch arrays"""
+        if len(idx) != self.batch_size:
+            self._alloc_batch(len(idx))
+        np.take(self.states, idx, axis=0, out=self._b_s)
+        np.take(self.actions, idx, out=self._b_a)
+        np.take(self.rewards, idx, out=self._b_r)
+        np.take(self.next_states, idx, axis=0, out=self._b_s2)
+        np.take(self.dones, idx, out=self._b_d)
+        return self._b_s, self._b_a, self._b_r, self._b_s2, self._b_d
+
+    def sample(self, batch_size):
+        return self.gather(self.sample_indices(batch_size))
+
+    def state_dict(self):
+        """Filled part of the buffer + ring position and RNG state (for checkpoints)"""
+        n = self.size
+        return {
+            "capacity": self.capacity, "pos": self.pos, "size": n,
+            "rng": self.rng.bit_generator.state,
+            "states": self.states[:n].copy(), "actions": self.actions[:n].copy(),
+            "rewards": self.rewards[:n].copy(), "next_states": self.next_states[:n].copy(),
+            "dones": self.dones[:n].copy(),
+        }
+
+    def load_state_dict(self, state):
+        if state["capacity"] != self.capacity:
+            raise ValueError("replay capacity %d in checkpoint, %d expected" % (state["capacity"], self.capacity))
+        n = state["size"]
+        self.states[:n] = state["states"]
+        self.actions[:n] = state["actions"]
+        self.rewards[:n] = state["rewards"]
+        self.next_states[:n] = state["next_states"]
+        self.dones[:n] = state["dones"]
+        self.pos = state["pos"]
+        self.size = n
+        self.rng.bit_generator.state = state["rng"]
+
+class SumTree:
+    """Binary tree of priority sums stored in one array (leaves at [n, 2n))"""
+    def __init__(self, capacity):
+        n = 1
+        while n < capacity:
+            n *= 2
+        self.n = n
+        self.depth = n.bit_length() - 1
+        self.tree = np.zeros(2 * n, dtype=np.float64)
+
+    def total(self):
+        return self.tree[1]
+
+    def update(self, leaves, priorities):
+        """Set leaf priorities then recompute the parents, one level at a time"""
+        nodes = np.asarray(leaves, dtype=np.int64) + self.n
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = np.unique(nodes // 2)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values):
+        """Leaf index whose cumulative priority range contains each value"""
+        v = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(v), dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            right = v > left_sum
+            v -= np.where(right, left_sum, 0.0)
+            nodes = left + right
+        return nodes - self.n
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    def __init__(self, capacity, state_dim, batch_size=64, alpha=0.6, eps=1e-3, seed=None):
+        super().__init__(capacity, state_dim, batch_size, seed)
+        self.alpha = alpha
+        self.eps = eps
+        self.tree = SumTree(capacity)
+        self.max_priority = 1.0
+
+    def push(self, s, a, r, s2, done):
+        i = self.pos
+        super().push(s, a, r, s2, done)
+        # New transitions get the max priority so they are replayed at least once
+        self.tree.update([i], [self.max_priority])
+
+    def push_batch(self, s, a, r, s2, done):
+        idx = (self.pos + np.arange(len(a))) % self.capacity
+        super().push_batch(s, a, r, s2, done)
+        self.tree.update(idx, np.full(len(idx), self.max_priority))
+
+    def sample_prioritized(self, batch_size, beta=0.4):
+        """((s, a, r, s2, done), importance weights, indices)"""
+        # Stratified: one uniform draw per equal slice of the total priority
+        total = self.tree.total()
+        bounds = np.arange(batch_size, dtype=np.float64) * (total / batch_size)
+        values = bounds + self.rng.random(batch_size) * (total / batch_size)
+        idx = np.minimum(self.tree.find(values), self.size - 1)
+
+        probs = self.tree.tree[idx + self.tree.n] / total
+        weights = (self.size * np.maximum(probs, 1e-12)) ** (-beta)
+        weights = (weights / weights.max()).astype(np.float32)
+        return self.gather(idx), weights, idx
+
+    def state_dict(self):
+        state = super().state_dict()
+        state["priorities"] = self.tree.tree[self.tree.n:self.tree.n + self.size].copy()
+        state["max_priority"] = self.max_priority
+        return state
+
+    def load_state_dict(self, state):
+        super().load_state_dict(state)
+        self.tree = SumTree(self.capacity)
+        self.tree.update(np.arange(self.size), state["priorities"])
+        self.max_priority = state["max_priority"]
+
+    def update_priorities(self, idx, td_errors):
+        priorities = (np.abs(td_errors) + self.eps) ** self.alpha
+        self.tree.update(idx, priorities)
+        self.max_priority = max(self.max_priority, float(priorities.max()))
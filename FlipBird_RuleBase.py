@@ -1,4 +1,5 @@
-import pygame, random, sys
+import pygame, sys
+from FlipBird_Course import Course
 
 # Initialisation
 pygame.init()
@@ -38,8 +39,13 @@ font = pygame.font.SysFont("Arial", 24, bold=True)
 # Mode de jeu
 mode_auto = None   # None = menu, True = auto, False = manuel
 
+# Parcours seedé (None = seed aléatoire) : chaque partie relit les mêmes tuyaux
+SEED_COURSE = None
+course = Course(SEED_COURSE, 100, 400)
+lecteur = course.lecteur()
+
 def creer_tuyau():
-    hauteur = random.randint(100, 400)
+    hauteur = lecteur.suivant()
     return {"x": LARGEUR, "haut": hauteur, "bas": hauteur + ecart}
 
 def afficher_tuyaux():
@@ -100,9 +106,10 @@ def afficher_bouton(txt, x, y, w, h, couleur, couleur_hover, action=None):
 
 def reset_jeu():
     """Réinitialise les variables du jeu"""
-    global oiseau_y, vitesse, tuyaux, score, en_jeu
+    global oiseau_y, vitesse, tuyaux, score, en_jeu, lecteur
     oiseau_y = HAUTEUR // 2
     vitesse = 0
+    lecteur = course.lecteur()
     tuyaux = [creer_tuyau()]
     score = 0
     en_jeu = True
@@ -0,0 +1,231 @@
+"""
+Moteur de simulation headless pour FlipBird GA
+- Reprend exactement Bot.update et le défilement/score des tuyaux
+  de FlipBird_GA_TAM.play_ga
+- Aucun import pygame : ni affichage, ni mixer, ni clock.tick
+- Tuyaux lus dans un parcours seedé (FlipBird_Course) : aucun tirage aléatoire
+  dans la boucle et des générations rejouables
+- Tuyaux dans une FileTuyaux (FlipBird_Tuyaux) : pas de dict par tuyau
+- Collision contre le seul tuyau de la colonne de l'oiseau (FlipBird_Collision)
+- Lancement : python FlipBird_Sim.py --generations 1000 --pop 30 --seed 1
+  (--moteur numpy pour la population vectorisée de FlipBird_SimNumpy,
+   --processus N pour répartir la population sur N coeurs,
+   --course SEED pour garder le même parcours à chaque génération,
+   --csv FICHIER pour journaliser chaque oiseau comme birds_evolution_ga.csv,
+   --bin FICHIER pour le même journal au format binaire de FlipBird_Log)
+"""
+
+import argparse
+import random
+import time
+
+from FlipBird_Course import Course
+from FlipBird_Tuyaux import FileTuyaux
+from FlipBird_Collision import Colonne
+
+# =============================================================================
+# === Paramètres du jeu (identiques à FlipBird_GA_TAM) ===
+# =============================================================================
+LARGEUR, HAUTEUR = 600, 600
+GRAVITE = 0.5
+SAUT = -8
+VITESSE_TUYAUX = 3
+LARGEUR_TUYAU = 60
+ECART = 150
+RAYON = 12
+BIRD_X = 60
+
+# === Paramètres GA ===
+POP_SIZE = 30
+MUTATION_RATE = 0.2
+
+# =============================================================================
+# === Tuyaux ===
+# =============================================================================
+def nouvelle_course(seed=None):
+    """Parcours aux mêmes bornes que l'ancien creer_tuyau de GA_TAM (randint(80, HAUTEUR-220))"""
+    return Course(seed, 80, HAUTEUR - 220)
+
+def creer_tuyaux(lecteur):
+    return FileTuyaux(lecteur, LARGEUR, VITESSE_TUYAUX, LARGEUR_TUYAU, ECART, bird_x=BIRD_X)
+
+# =============================================================================
+# === Classe Bot (GA) sans rendu ===
+# =============================================================================
+class Bot:
+    def __init__(self, threshold=None, rng=random):
+        self.x = BIRD_X
+        self.y = HAUTEUR // 2
+        self.v = 0
+        self.alive = True
+        self.pipes_passed = 0
+        self.threshold = threshold if threshold is not None else rng.uniform(-50, 50)
+
+    def update(self, tuyaux, colonne):
+        """Avance d'une frame ; renvoie True si le bot vient de mourir"""
+        if not self.alive: return False
+        self.v += GRAVITE
+        self.y += self.v
+        # La file n'est jamais vide : plus de test "if tuyaux"
+        if self.y > tuyaux.centre + self.threshold:
+            self.v = SAUT
+        if self.y - RAYON < 0 or self.y + RAYON > HAUTEUR:
+            self.alive = False
+        if colonne.tuyau >= 0 and (self.y - RAYON < colonne.haut or self.y + RAYON > colonne.bas):
+            self.alive = False
+        return not self.alive
+
+# =============================================================================
+# === Population (liste de Bots) ===
+# =============================================================================
+class Population:
+    def __init__(self, thresholds):
+        self.bots = [Bot(th) for th in thresholds]
+
+    def __len__(self):
+        return len(self.bots)
+
+    def marquer_point(self):
+        for bot in self.bots:
+            if bot.alive: bot.pipes_passed += 1
+
+    def update(self, tuyaux, colonne):
+        """Avance tous les bots ; renvoie le nombre de morts de la frame"""
+        morts = 0
+        for bot in self.bots:
+            if bot.update(tuyaux, colonne): morts += 1
+        return morts
+
+    def nb_vivants(self):
+        return sum(bot.alive for bot in self.bots)
+
+    def scores(self):
+        return [bot.pipes_passed for bot in self.bots]
+
+    def thresholds(self):
+        return [bot.threshold for bot in self.bots]
+
+# =============================================================================
+# === Simulation d'une génération ===
+# =============================================================================
+class Simulation:
+    def __init__(self, population, course):
+        self.population = population
+        self.lecteur = course.lecteur()
+        self.tuyaux = creer_tuyaux(self.lecteur)
+        self.colonne = Colonne(BIRD_X, RAYON, LARGEUR_TUYAU)
+        self.frame = 0
+
+    def step(self):
+        """Une frame de play_ga ; renvoie (tuyaux passés, morts)"""
+        # Déplacement tuyaux + calcul score
+        points = self.tuyaux.avancer()
+        for _ in range(points):
+            self.population.marquer_point()
+
+        self.colonne.maj(self.tuyaux)
+        morts = self.population.update(self.tuyaux, self.colonne)
+        self.frame += 1
+        return points, morts
+
+    def run(self, max_frames=None):
+        """Joue jusqu'à la mort de tous les bots (ou max_frames)"""
+        while self.population.nb_vivants():
+            if max_frames is not None and self.frame >= max_frames:
+                break
+            self.step()
+        return self.population.scores()
+
+# =============================================================================
+# === Fonctions GA ===
+# =============================================================================
+def crossover(th1, th2, rng=random):
+    child_threshold = (th1 + th2) / 2
+    if rng.random() < MUTATION_RATE:
+        child_threshold += rng.uniform(-20, 20)
+    return child_threshold
+
+def next_generation(thresholds, scores, pop_size=POP_SIZE, rng=random):
+    """Sélection du top 25% + croisement ; renvoie les nouveaux seuils"""
+    classes = sorted(zip(thresholds, scores), key=lambda b: b[1], reverse=True)
+    best = [th for th, _ in classes[:pop_size//4]]
+    new_pop = []
+    while len(new_pop) < pop_size:
+        p1, p2 = rng.sample(best, 2)
+        new_pop.append(crossover(p1, p2, rng))
+    return new_pop
+
+def jouer_generation(thresholds, course, max_frames=None):
+    """Évalue une génération complète ; renvoie les pipes_passed de chaque bot"""
+    sim = Simulation(Population(thresholds), course)
+    return sim.run(max_frames)
+
+# =============================================================================
+# === Entraînement GA headless ===
+# =============================================================================
+def entrainer(generations, pop_size=POP_SIZE, seed=None, max_frames=None, verbose=True,
+              jouer=jouer_generation, course=None, journal=None):
+    """course : parcours commun à toutes les générations (sinon un par génération)
+    journal : JournalCSV / JournalBinaire optionnel recevant chaque génération"""
+    rng = random.Random(seed)
+    thresholds = [rng.uniform(-50, 50) for _ in range(pop_size)]
+    history = []  # (gen, best, avg)
+    for generation in range(1, generations + 1):
+        course_gen = course if course is not None else nouvelle_course(rng.getrandbits(32))
+        scores = jouer(thresholds, course_gen, max_frames)
+        best_score = max(scores)
+        avg_score = sum(scores) / len(scores)
+        history.append((generation, best_score, avg_score))
+        if journal is not None:
+            journal.ajouter_generation(generation, scores, thresholds)
+        if verbose:
+            print(f"Gen {generation} | Best {best_score} | Avg {avg_score:.2f}")
+        thresholds = next_generation(thresholds, scores, pop_size, rng)
+    return history
+
+def main():
+    parser = argparse.ArgumentParser(description="FlipBird GA headless")
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--pop", type=int, default=POP_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-frames", type=int, default=None,
+                        help="limite de frames par génération (bots parfaits)")
+    parser.add_argument("--moteur", choices=["python", "numpy"], default="python")
+    parser.add_argument("--course", type=int, default=None,
+                        help="seed d'un parcours fixe pour toutes les générations")
+    parser.add_argument("--csv", default=None, help="journal CSV (Generation, Bird_ID, Score)")
+    parser.add_argument("--bin", default=None, help="journal binaire (memmap)")
+    parser.add_argument("--processus", type=int, default=None,
+                        help="nombre de processus (0 = tous les coeurs)")
+    args = parser.parse_args()
+
+    jouer = jouer_generation
+    if args.moteur == "numpy":
+        from FlipBird_SimNumpy import jouer_generation_numpy as jouer
+    if args.processus is not None:
+        from FlipBird_Parallele import EvaluateurParallele
+        jouer = EvaluateurParallele(args.processus or None, args.moteur)
+
+    journal = None
+    if args.csv:
+        from FlipBird_Log import JournalCSV
+        journal = JournalCSV(args.csv)
+    elif args.bin:
+        from FlipBird_Log import JournalBinaire
+        journal = JournalBinaire(args.bin)
+
+    debut = time.perf_counter()
+    try:
+        course = nouvelle_course(args.course) if args.course is not None else None
+        history = entrainer(args.generations, args.pop, args.seed, args.max_frames,
+                            jouer=jouer, course=course, journal=journal)
+    finally:
+        if hasattr(jouer, "close"): jouer.close()
+        if journal is not None: journal.close()
+    duree = time.perf_counter() - debut
+    print(f"{len(history)} générations en {duree:.2f}s "
+          f"({len(history) / max(duree, 1e-9):.1f} gen/s)")
+
+# === Lancement ===
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Population GA vectorisée (NumPy) pour le moteur headless FlipBird_Sim
+- y, v, alive, pipes_passed et threshold sont des tableaux NumPy
+- Une frame = quelques opérations sur tableaux, quel que soit POP_SIZE
+- Même règle que Bot.update (GA_TAM, GA_Table, GA3_Menu, GA1_Auto)
+"""
+
+import numpy as np
+
+from FlipBird_Sim import HAUTEUR, GRAVITE, SAUT, RAYON, Simulation
+from FlipBird_Collision import collision_population
+
+# =============================================================================
+# === Population vectorisée ===
+# =============================================================================
+class PopulationNumpy:
+    def __init__(self, thresholds):
+        n = len(thresholds)
+        self.threshold = np.asarray(thresholds, dtype=np.float64).copy()
+        self.y = np.full(n, HAUTEUR // 2, dtype=np.float64)
+        self.v = np.zeros(n, dtype=np.float64)
+        self.alive = np.ones(n, dtype=bool)
+        self.pipes_passed = np.zeros(n, dtype=np.int64)
+        # Tampons préalloués (pas d'allocation par frame)
+        self._seuil = np.empty(n, dtype=np.float64)
+        self._mort = np.empty(n, dtype=bool)
+        self._tmp = np.empty(n, dtype=bool)
+
+    def __len__(self):
+        return len(self.y)
+
+    def marquer_point(self):
+        np.add(self.pipes_passed, self.alive, out=self.pipes_passed, casting="unsafe")
+
+    def update(self, tuyaux, colonne):
+        """Avance tous les bots vivants ; renvoie le nombre de morts de la frame"""
+        a = self.alive
+        np.add(self.v, GRAVITE, out=self.v, where=a)
+        np.add(self.y, self.v, out=self.y, where=a)
+
+        # Saut si l'oiseau est sous centre + threshold
+        np.add(self.threshold, tuyaux.centre, out=self._seuil)
+        np.greater(self.y, self._seuil, out=self._tmp)
+        self._tmp &= a
+        self.v[self._tmp] = SAUT
+
+        # Plafond, sol et tuyau de la colonne : une seule comparaison par borne
+        mort = collision_population(self.y, colonne, RAYON, HAUTEUR, self._mort, self._tmp)
+
+        mort &= a
+        a &= ~mort
+        return int(np.count_nonzero(mort))
+
+    def nb_vivants(self):
+        return int(np.count_nonzero(self.alive))
+
+    def scores(self):
+        return self.pipes_passed.tolist()
+
+    def thresholds(self):
+        return self.threshold.tolist()
+
+def jouer_generation_numpy(thresholds, course, max_frames=None):
+    """Équivalent vectorisé de FlipBird_Sim.jouer_generation"""
+    sim = Simulation(PopulationNumpy(thresholds), course)
+    return sim.run(max_frames)
@@ -0,0 +1,62 @@
+"""
+Cache des polices et des textes rendus (pygame)
+- CacheTexte : une seule police SysFont par (nom, taille, gras) et un cache LRU
+  des surfaces rendues par (texte, taille, couleur, nom, gras)
+- HUD : champs de texte qui ne sont re-rendus que si leur valeur change
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+TAILLE_CACHE = 256  # surfaces gardées en mémoire (LRU)
+
+# =============================================================================
+# === Cache des polices et des surfaces de texte ===
+# =============================================================================
+class CacheTexte:
+    def __init__(self, taille_max=TAILLE_CACHE):
+        self.taille_max = taille_max
+        self.polices = {}
+        self.surfaces = OrderedDict()
+
+    def police(self, size, nom=None, bold=False):
+        cle = (nom, size, bold)
+        font = self.polices.get(cle)
+        if font is None:
+            font = pygame.font.SysFont(nom, size, bold=bold)
+            self.polices[cle] = font
+        return font
+
+    def rendu(self, text, size, color, nom=None, bold=False):
+        """Surface du texte, rendue une seule fois tant qu'elle reste dans le cache"""
+        cle = (text, size, tuple(color), nom, bold)
+        surface = self.surfaces.get(cle)
+        if surface is not None:
+            self.surfaces.move_to_end(cle)
+            return surface
+        surface = self.police(size, nom, bold).render(text, True, color)
+        self.surfaces[cle] = surface
+        if len(self.surfaces) > self.taille_max:
+            self.surfaces.popitem(last=False)
+        return surface
+
+# =============================================================================
+# === HUD : champs re-rendus seulement quand la valeur change ===
+# =============================================================================
+class HUD:
+    def __init__(self, font):
+        self.font = font
+        self.champs = {}  # nom -> (texte, couleur, surface)
+
+    def surface(self, nom, texte, color):
+        champ = self.champs.get(nom)
+        if champ is None or champ[0] != texte or champ[1] != color:
+            champ = (texte, color, self.font.render(texte, True, color))
+            self.champs[nom] = champ
+        return champ[2]
+
+    def dessiner(self, ecran, nom, texte, pos, color=(0, 0, 0)):
+        surface = self.surface(nom, texte, color)
+        ecran.blit(surface, pos)
+        return surface.get_rect(topleft=pos)
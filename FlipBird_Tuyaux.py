@@ -0,0 +1,112 @@
+"""
+File de tuyaux compacte (remplace la liste de dicts {"x", "haut", "bas", "passed"})
+- Tampon circulaire de capacité fixe : listes parallèles préallouées pour
+  l'abscisse, le haut et le bas du trou ; ajout / retrait en O(1), aucune
+  allocation par tuyau (les listes s'indexent plus vite qu'un array en Python)
+- Défilement par décalage : seul self.decalage avance à chaque frame, l'abscisse
+  écran d'un tuyau vaut monde - decalage (pas de boucle sur les tuyaux)
+- Les tuyaux sont repérés par un index absolu k (debut <= k < fin) ; prochain
+  est l'index du premier tuyau que l'oiseau n'a pas encore passé ; centre est
+  le centre du trou du premier tuyau de la file (cible des bots du GA)
+- La file n'est jamais vide (un tuyau dès reset())
+- Mêmes règles que play_ga de FlipBird_GA_TAM : apparition en x = LARGEUR quand
+  le dernier tuyau passe sous LARGEUR - ESPACEMENT, retrait sous -LARGEUR_TUYAU
+"""
+
+# =============================================================================
+# === Paramètres (identiques à FlipBird_GA_TAM) ===
+# =============================================================================
+LARGEUR = 600
+VITESSE_TUYAUX = 3
+LARGEUR_TUYAU = 60
+ECART = 150
+ESPACEMENT = 200   # un nouveau tuyau apparaît quand le dernier passe sous LARGEUR - ESPACEMENT
+BIRD_X = 60
+CAPACITE = 8       # tuyaux à l'écran au maximum (puissance de 2) ; 4 suffisent en 600 px
+
+# =============================================================================
+# === File circulaire de tuyaux ===
+# =============================================================================
+class FileTuyaux:
+    __slots__ = ("lecteur", "largeur", "vitesse", "largeur_tuyau", "ecart", "espacement",
+                 "bird_x", "masque", "monde", "haut", "bas", "debut", "fin", "prochain", "decalage",
+                 "centre")
+
+    def __init__(self, lecteur, largeur=LARGEUR, vitesse=VITESSE_TUYAUX, largeur_tuyau=LARGEUR_TUYAU,
+                 ecart=ECART, espacement=ESPACEMENT, bird_x=BIRD_X, capacite=CAPACITE):
+        """lecteur : Lecteur de FlipBird_Course (ou tout objet avec suivant())"""
+        if capacite & (capacite - 1):
+            raise ValueError("capacite doit être une puissance de 2")
+        self.largeur, self.vitesse, self.largeur_tuyau = largeur, vitesse, largeur_tuyau
+        self.ecart, self.espacement, self.bird_x = ecart, espacement, bird_x
+        self.masque = capacite - 1
+        self.monde = [0] * capacite  # abscisse d'apparition + décalage à ce moment
+        self.haut = [0] * capacite
+        self.bas = [0] * capacite
+        self.reset(lecteur)
+
+    def reset(self, lecteur=None):
+        """Nouvelle partie : un seul tuyau, en x = largeur"""
+        if lecteur is not None:
+            self.lecteur = lecteur
+        self.debut = self.fin = self.prochain = 0
+        self.decalage = 0
+        self.ajouter(self.lecteur.suivant())
+        self._maj_centre()
+
+    def __len__(self):
+        return self.fin - self.debut
+
+    def ajouter(self, h):
+        """Nouveau tuyau (haut du trou = h) à droite de l'écran"""
+        if self.fin - self.debut > self.masque:
+            raise IndexError("File de tuyaux pleine")
+        i = self.fin & self.masque
+        self.monde[i] = self.largeur + self.decalage
+        self.haut[i] = h
+        self.bas[i] = h + self.ecart
+        self.fin += 1
+
+    def retirer(self):
+        if self.fin - self.debut < 2:
+            raise IndexError("La file garde au moins un tuyau")
+        self.debut += 1
+        if self.prochain < self.debut:
+            self.prochain = self.debut
+        self._maj_centre()
+
+    def _maj_centre(self):
+        i = self.debut & self.masque
+        self.centre = (self.haut[i] + self.bas[i]) / 2
+
+    # --- Accès par index absolu k ---
+    def x(self, k):
+        return self.monde[k & self.masque] - self.decalage
+
+    def trou(self, k):
+        """(haut, bas) du trou du tuyau k"""
+        i = k & self.masque
+        return self.haut[i], self.bas[i]
+
+    def tuyaux(self):
+        """(x, haut, bas) de chaque tuyau, de gauche à droite (rendu)"""
+        m, d = self.masque, self.decalage
+        for k in range(self.debut, self.fin):
+            i = k & m
+            yield self.monde[i] - d, self.haut[i], self.bas[i]
+
+    # --- Une frame ---
+    def avancer(self):
+        """Défilement + retrait / apparition + score ; renvoie le nombre de tuyaux passés"""
+        self.decalage += self.vitesse
+        if self.x(self.debut) < -self.largeur_tuyau:
+            self.retirer()
+        if self.x(self.fin - 1) < self.largeur - self.espacement:
+            self.ajouter(self.lecteur.suivant())
+        # Les tuyaux sont triés par x : seuls les premiers non passés peuvent l'être
+        points = 0
+        limite = self.bird_x - self.largeur_tuyau
+        while self.prochain < self.fin and self.x(self.prochain) < limite:
+            self.prochain += 1
+            points += 1
+        return points